@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Documentation Scripts Benchmark
+
+This script generates synthetic Starlight documentation corpora and times the
+hot paths of check-diataxis.py and migrate-docs.py against them, so that
+performance regressions are caught before release.
+
+Usage:
+    ./scripts/benchmark-scripts.py generate OUT_DIR [--pages N] [corpus options]
+    ./scripts/benchmark-scripts.py run [--sizes 1000,10000,100000] [--save-baseline]
+
+Examples:
+    # Generate a 5,000 page corpus to inspect or check by hand
+    ./scripts/benchmark-scripts.py generate /tmp/corpus --pages 5000
+
+    # Time everything at 1k/10k/100k pages and compare with the baseline
+    ./scripts/benchmark-scripts.py run
+
+    # Quick run at a single size
+    ./scripts/benchmark-scripts.py run --sizes 1000
+
+    # Record new baseline numbers (after an intended performance change)
+    ./scripts/benchmark-scripts.py run --save-baseline
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = SCRIPTS_DIR / 'benchmark-baseline.json'
+
+
+def load_script(name: str, filename: str):
+    """Import one of the hyphen-named scripts in this directory as a module."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+check_diataxis = load_script('check_diataxis', 'check-diataxis.py')
+migrate_docs = load_script('migrate_docs', 'migrate-docs.py')
+
+
+@dataclass
+class CorpusShape:
+    """Knobs for the synthetic corpus."""
+    page_lines: int = 60
+    frontmatter: str = 'mixed'  # full, minimal, none, mixed
+    code_density: float = 0.15  # chance that a paragraph is followed by a code block
+    anti_pattern_density: float = 0.05  # chance that a sentence is an anti-pattern
+    seed: int = 1
+
+
+# Directory and sentence material per Diataxis type
+TYPE_DIRS = {
+    'tutorial': 'tutorials',
+    'how-to': 'how-to',
+    'reference': 'reference',
+    'explanation': 'explanations',
+}
+
+TYPICAL_SENTENCES = {
+    'tutorial': [
+        "In this tutorial, you will build a working calendar server.",
+        "Let's start by creating the configuration file.",
+        "By the end of this section the server answers requests.",
+        "Step {n}: run the command below and check the output.",
+        "You will create a collection for your events.",
+    ],
+    'how-to': [
+        "This guide shows how to enable the feature on an existing server.",
+        "To configure the backend, edit the storage section.",
+        "Set up the reverse proxy before exposing the service.",
+        "Create the user and add it to the rights file.",
+        "Remove the old collection once the sync has finished.",
+    ],
+    'reference': [
+        "This page describes every option of the storage section.",
+        "| `filesystem_folder` | string | Folder that contains the collections |",
+        "Returns: the list of collections visible to the user.",
+        "Parameters: `path` specifies the collection to read.",
+        "The section defines the defaults that every request includes.",
+    ],
+    'explanation': [
+        "The server stores items as files because that keeps backups simple.",
+        "Understanding the sync model explains the behaviour of clients.",
+        "The reason for this design is the lack of server-side locking.",
+        "Why does the server reject the request? The ETag no longer matches.",
+        "This is how the scheduling inbox works in practice.",
+    ],
+}
+
+ANTI_PATTERN_SENTENCES = {
+    'tutorial': [
+        "You can optionally skip this part if you want to.",
+        "Consider the various ways to run the server.",
+    ],
+    'how-to': [
+        "First read the overview, then the details, finally the summary.",
+        "Let's learn about the concept behind the setting and why it exists.",
+    ],
+    'reference': [
+        "We recommend the default as a best practice.",
+        "First, open the file, then edit the value.",
+    ],
+    'explanation': [
+        "Step 1: configure the server and enable the option.",
+        "You must run curl -X PUT against the collection.",
+    ],
+}
+
+FILLER_WORDS = (
+    "calendar collection server client request response storage item event "
+    "contact sync token header property value option section file user"
+).split()
+
+
+def generate_page(rng: random.Random, diataxis_type: str, index: int, shape: CorpusShape) -> str:
+    """Build the text of one synthetic .mdx page."""
+    lines: List[str] = []
+
+    frontmatter = shape.frontmatter
+    if frontmatter == 'mixed':
+        frontmatter = rng.choices(['full', 'minimal', 'none'], weights=[8, 1, 1])[0]
+
+    if frontmatter != 'none':
+        lines.append('---')
+        lines.append(f"title: {diataxis_type.title()} page {index}")
+        if frontmatter == 'full':
+            lines.append(f"description: Synthetic {diataxis_type} page for benchmarking")
+            lines.append(f"diataxis_type: {diataxis_type}")
+            lines.append('sidebar:')
+            lines.append(f"  order: {index % 100}")
+        lines.append('---')
+        lines.append('')
+
+    section = 0
+    while len(lines) < shape.page_lines:
+        section += 1
+        lines.append(f"## Section {section}")
+        lines.append('')
+
+        for _ in range(rng.randint(2, 5)):
+            if rng.random() < shape.anti_pattern_density:
+                sentence = rng.choice(ANTI_PATTERN_SENTENCES[diataxis_type])
+            elif rng.random() < 0.5:
+                sentence = rng.choice(TYPICAL_SENTENCES[diataxis_type]).format(n=section)
+            else:
+                words = rng.choices(FILLER_WORDS, k=rng.randint(8, 16))
+                sentence = ' '.join(words).capitalize() + '.'
+            lines.append(sentence)
+        lines.append('')
+
+        if rng.random() < shape.code_density:
+            lines.append('```ini')
+            lines.append('[storage]')
+            lines.append(f"filesystem_folder = /var/lib/radicale/collections/{index}")
+            lines.append('```')
+            lines.append('')
+
+    return '\n'.join(lines[:max(shape.page_lines, 1)]) + '\n'
+
+
+def generate_corpus(out_dir: Path, pages: int, shape: CorpusShape) -> Path:
+    """Write a Starlight-style docs tree of ``pages`` pages; returns the docs root."""
+    rng = random.Random(shape.seed)
+    docs_root = out_dir / 'src' / 'content' / 'docs'
+    types = list(TYPE_DIRS)
+
+    for index in range(pages):
+        diataxis_type = types[index % len(types)]
+        # Keep directories to a few hundred entries each
+        group_dir = docs_root / TYPE_DIRS[diataxis_type] / f"group-{index // 2000:03d}"
+        group_dir.mkdir(parents=True, exist_ok=True)
+        page = generate_page(rng, diataxis_type, index, shape)
+        (group_dir / f"page-{index:06d}.mdx").write_text(page, encoding='utf-8')
+
+    return docs_root
+
+
+def generate_source(pages: int, shape: CorpusShape) -> List[str]:
+    """Build an ADVANCED-FEATURES.md-like source with one section per page."""
+    rng = random.Random(shape.seed)
+    types = list(TYPE_DIRS)
+    lines: List[str] = []
+
+    for index in range(pages):
+        diataxis_type = types[index % len(types)]
+        page = generate_page(rng, diataxis_type, index, CorpusShape(
+            page_lines=shape.page_lines,
+            frontmatter='none',
+            code_density=shape.code_density,
+            anti_pattern_density=shape.anti_pattern_density,
+            seed=shape.seed,
+        ))
+        lines.append(f"## Feature {index}\n")
+        lines.extend(line + '\n' for line in page.splitlines())
+
+    return lines
+
+
+def source_sections(source_lines: List[str]) -> List:
+    """One migrate-docs Section per '## Feature' block of a generated source."""
+    starts = [i + 1 for i, line in enumerate(source_lines) if line.startswith('## Feature ')]
+    ends = [start - 1 for start in starts[1:]] + [len(source_lines)]
+    types = list(TYPE_DIRS)
+
+    return [
+        migrate_docs.Section(
+            title=f"Feature {index}",
+            start_line=start,
+            end_line=end,
+            diataxis_type=types[index % len(types)],
+            target_path=f"src/content/docs/{TYPE_DIRS[types[index % len(types)]]}/group-{index // 2000:03d}/feature-{index:06d}.mdx",
+            description=f"Synthetic feature {index}",
+        )
+        for index, (start, end) in enumerate(zip(starts, ends))
+    ]
+
+
+def time_calls(items, func: Callable) -> float:
+    """Total time spent inside func over all items, excluding the setup."""
+    total = 0.0
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        total += time.perf_counter() - start
+    return total
+
+
+def iter_contents(files: List[Path]):
+    """Yield (path, content) one file at a time so memory stays flat."""
+    for file_path in files:
+        yield file_path, file_path.read_text(encoding='utf-8')
+
+
+def run_size(pages: int, shape: CorpusShape, work_dir: Path) -> Dict[str, float]:
+    """Benchmark every hot path at one corpus size; returns seconds per path."""
+    print(f"\nGenerating {pages} page(s)...")
+    docs_root = generate_corpus(work_dir / f"corpus-{pages}", pages, shape)
+    files = sorted(docs_root.rglob('*.mdx'))
+    timings: Dict[str, float] = {}
+
+    timings['analyze_file'] = time_calls(files, check_diataxis.analyze_file)
+
+    # Parsing is timed with each check: both started from the file content
+    # when the baseline was recorded, so the numbers stay comparable
+    timings['infer_content_type'] = time_calls(
+        iter_contents(files),
+        lambda item: check_diataxis.infer_content_type(check_diataxis.parse_document(*item))
+    )
+    timings['check_content_patterns'] = time_calls(
+        iter_contents(files),
+        lambda item: check_diataxis.check_content_patterns(check_diataxis.parse_document(*item))
+    )
+
+    start = time.perf_counter()
+    for _ in check_diataxis.scan_directory(docs_root, jobs=1, log=lambda message: None):
+        pass
+    timings['scan_directory'] = time.perf_counter() - start
+
+    source_lines = generate_source(pages, shape)
+    sections = source_sections(source_lines)
+    out_base = work_dir / f"migrated-{pages}"
+    with contextlib.redirect_stdout(io.StringIO()):
+        timings['migrate_section'] = time_calls(
+            sections,
+            lambda section: migrate_docs.migrate_section(source_lines, section, out_base)
+        )
+
+    for name, seconds in timings.items():
+        print(f"  {name:24} {seconds:9.3f}s  {seconds / pages * 1e6:9.1f} µs/page")
+
+    return timings
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict, tolerance: float) -> bool:
+    """Print the ratio to the baseline per path; returns False on regression."""
+    ok = True
+    print(f"\n{'='*60}")
+    print(f"COMPARISON WITH BASELINE (tolerance: +{tolerance:.0%})")
+    print(f"{'='*60}")
+
+    for size, timings in results.items():
+        base_timings = baseline.get('results', {}).get(size)
+        if not base_timings:
+            print(f"{size} pages: no baseline")
+            continue
+
+        for name, seconds in timings.items():
+            base_seconds = base_timings.get(name)
+            if not base_seconds:
+                continue
+            ratio = seconds / base_seconds
+            status = 'REGRESSION' if ratio > 1 + tolerance else 'ok'
+            if status != 'ok':
+                ok = False
+            print(f"  {size:>7} pages  {name:24} {ratio:6.2f}x  {status}")
+
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the documentation scripts on synthetic corpora',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_shape_arguments(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument('--page-lines', type=int, default=60, help='Lines per page (default: 60)')
+        sub.add_argument(
+            '--frontmatter',
+            choices=['full', 'minimal', 'none', 'mixed'],
+            default='mixed',
+            help='Frontmatter shape (default: mixed, mostly full)'
+        )
+        sub.add_argument('--code-density', type=float, default=0.15, help='Chance of a code block per section')
+        sub.add_argument('--anti-pattern-density', type=float, default=0.05, help='Chance of an anti-pattern per sentence')
+        sub.add_argument('--seed', type=int, default=1, help='Random seed (default: 1)')
+
+    generate = subparsers.add_parser('generate', help='Write a synthetic corpus to disk')
+    generate.add_argument('out', type=Path, help='Output directory')
+    generate.add_argument('--pages', type=int, default=1000, help='Number of pages (default: 1000)')
+    add_shape_arguments(generate)
+
+    run = subparsers.add_parser('run', help='Run the benchmarks')
+    run.add_argument(
+        '--sizes',
+        default='1000,10000,100000',
+        help='Comma-separated corpus sizes in pages (default: 1000,10000,100000)'
+    )
+    run.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help='Baseline file')
+    run.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    run.add_argument('--no-compare', action='store_true', help="Don't compare with the baseline")
+    run.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.25,
+        help='Allowed slowdown before a path counts as regressed (default: 0.25)'
+    )
+    run.add_argument('--work-dir', type=Path, help='Keep generated corpora here instead of a temp dir')
+    add_shape_arguments(run)
+
+    args = parser.parse_args()
+
+    shape = CorpusShape(
+        page_lines=args.page_lines,
+        frontmatter=args.frontmatter,
+        code_density=args.code_density,
+        anti_pattern_density=args.anti_pattern_density,
+        seed=args.seed,
+    )
+
+    if args.command == 'generate':
+        docs_root = generate_corpus(args.out, args.pages, shape)
+        print(f"✓ Generated {args.pages} page(s) in {docs_root}")
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results: Dict[str, Dict[str, float]] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = args.work_dir or Path(tmp)
+        for pages in sizes:
+            results[str(pages)] = run_size(pages, shape, work_dir)
+
+    if args.save_baseline:
+        baseline = {}
+        if args.baseline.exists():
+            baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        baseline.setdefault('results', {}).update({
+            size: {name: round(seconds, 4) for name, seconds in timings.items()}
+            for size, timings in results.items()
+        })
+        baseline['shape'] = shape.__dict__
+        baseline['python'] = platform.python_version()
+        baseline['platform'] = platform.platform()
+        args.baseline.write_text(json.dumps(baseline, indent=2) + '\n', encoding='utf-8')
+        print(f"\n✓ Saved baseline: {args.baseline}")
+        return
+
+    if args.no_compare or not args.baseline.exists():
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    if baseline.get('shape') != shape.__dict__:
+        print("\nWarning: corpus shape differs from the baseline; ratios are not comparable",
+              file=sys.stderr)
+
+    if not compare(results, baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
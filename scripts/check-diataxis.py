@@ -7,6 +7,8 @@ follows Diataxis principles and patterns.
 
 Usage:
     ./scripts/check-diataxis.py [--fix] [--verbose] [path/to/docs/]
+    ./scripts/check-diataxis.py merge [--format FORMAT] REPORT.jsonl...
+    ./scripts/check-diataxis.py fit-weights [-o PACK] path/to/docs/
 
 Examples:
     # Check all docs
@@ -18,27 +20,205 @@ Examples:
     # Verbose output with suggestions
     ./scripts/check-diataxis.py --verbose
 
-    # Auto-fix frontmatter issues (experimental)
+    # Add a missing title and diataxis_type to frontmatter
     ./scripts/check-diataxis.py --fix
+
+    # Limit the number of worker processes
+    ./scripts/check-diataxis.py --jobs 4
+
+    # Re-analyze every file, ignoring cached results
+    ./scripts/check-diataxis.py --no-cache
+
+    # Check only files added, modified or renamed since a git ref
+    ./scripts/check-diataxis.py --since origin/main
+
+    # Stay running and report new/resolved violations as files are saved
+    ./scripts/check-diataxis.py --watch
+
+    # Machine-readable output for CI
+    ./scripts/check-diataxis.py --format jsonl > diataxis.jsonl
+    ./scripts/check-diataxis.py --format sarif > diataxis.sarif
+
+    # Split the run across CI nodes, then combine the shard reports
+    ./scripts/check-diataxis.py --shard 1/3 --format jsonl > shard-1.jsonl
+    ./scripts/check-diataxis.py merge shard-*.jsonl
+
+    # Show the 20 slowest rules and files
+    ./scripts/check-diataxis.py --profile --profile-top 20
+
+    # Replace or extend the built-in rules with a team rule pack
+    ./scripts/check-diataxis.py --rules team-rules.toml
+
+    # Learn indicator weights from docs that declare their type, then use them
+    ./scripts/check-diataxis.py fit-weights -o weights.json src/content/docs/
+    ./scripts/check-diataxis.py --rules weights.json
 """
 
 import argparse
+import contextlib
+import hashlib
+import heapq
+import json
+import os
 import re
+import subprocess
 import sys
-from dataclasses import dataclass, field
+import time
+import warnings
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from itertools import accumulate, chain, groupby
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, Iterator, List, Match, Optional, Pattern, Set, TextIO, Tuple, Union
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+# Regex parser internals, used only to extract prefilter literals; the
+# module moved in 3.11 and may change again, so the prefilter is simply
+# skipped when it is missing or parses differently
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    try:
+        import sre_parse
+    except ImportError:
+        sre_parse = None
+
+try:
+    import numpy  # Optional: vectorized scoring in fit-weights
+except ImportError:
+    numpy = None
+
+
+# Bump when a change to the checks themselves should invalidate cached results
+CHECKER_VERSION = '1.4'
+
+
+# Everything about a violation except where it occurred and its detail,
+# interned per process: (rule id, severity level, category code, message,
+# suggestion). Messages are fixed per rule, so the table stays small.
+_VIOLATION_KINDS: List[Tuple[str, int, int, str, Optional[str]]] = []
+_VIOLATION_KIND_CODES: Dict[Tuple[str, int, int, str, Optional[str]], int] = {}
+
+# Category names by code; codes are assigned on first use
+_CATEGORIES: List[str] = []
+_CATEGORY_CODES: Dict[str, int] = {}
+
+
+def category_code(category: str) -> int:
+    """Integer code for a violation category."""
+    code = _CATEGORY_CODES.get(category)
+    if code is None:
+        code = _CATEGORY_CODES[category] = len(_CATEGORIES)
+        _CATEGORIES.append(category)
+    return code
+
+
+def intern_violation_kind(
+    rule_id: str,
+    severity: str,
+    category: str,
+    message: str,
+    suggestion: Optional[str]
+) -> int:
+    """Index of a violation kind in the shared table, adding it if new."""
+    kind = (sys.intern(rule_id), SEVERITY_LEVELS[severity], category_code(category), message, suggestion)
+    code = _VIOLATION_KIND_CODES.get(kind)
+    if code is None:
+        code = _VIOLATION_KIND_CODES[kind] = len(_VIOLATION_KINDS)
+        _VIOLATION_KINDS.append(kind)
+    return code
 
 
-@dataclass
 class Violation:
-    """Represents a Diataxis compliance violation."""
-    file_path: Path
-    line_number: int
-    severity: str  # error, warning, info
-    category: str  # frontmatter, language, structure
-    message: str
-    suggestion: Optional[str] = None
+    """Represents a Diataxis compliance violation.
+
+    Only the file path (shared by every violation of a file), the line, an
+    index into the interned kind table and an optional detail are stored
+    per violation; the rule id, severity, category, message and suggestion
+    are read from the table. Text that differs between occurrences, such
+    as the matched phrase, is the ``detail`` and replaces '{detail}' in
+    the message and suggestion, so it never enters the table.
+    """
+
+    __slots__ = ('file_path', 'line_number', 'kind', 'detail')
+
+    def __init__(
+        self,
+        file_path: Path,
+        line_number: int,
+        severity: str,  # error, warning, info
+        category: str,  # frontmatter, language, structure
+        message: str,
+        suggestion: Optional[str] = None,
+        rule_id: Optional[str] = None,  # defaults to the category
+        detail: Optional[str] = None
+    ):
+        self.file_path = file_path
+        self.line_number = line_number
+        self.kind = intern_violation_kind(rule_id or category, severity, category, message, suggestion)
+        self.detail = detail
+
+    def fill(self, text: Optional[str]) -> Optional[str]:
+        """A message or suggestion of the kind with this violation's detail."""
+        if text is None or self.detail is None:
+            return text
+        return text.replace('{detail}', self.detail)
+
+    @property
+    def rule_id(self) -> str:
+        return _VIOLATION_KINDS[self.kind][0]
+
+    @property
+    def severity_level(self) -> int:
+        return _VIOLATION_KINDS[self.kind][1]
+
+    @property
+    def severity(self) -> str:
+        return SEVERITY_NAMES[_VIOLATION_KINDS[self.kind][1]]
+
+    @property
+    def category(self) -> str:
+        return _CATEGORIES[_VIOLATION_KINDS[self.kind][2]]
+
+    @property
+    def message(self) -> str:
+        return self.fill(_VIOLATION_KINDS[self.kind][3])
+
+    @property
+    def suggestion(self) -> Optional[str]:
+        return self.fill(_VIOLATION_KINDS[self.kind][4])
+
+    @property
+    def details(self) -> Tuple[str, str, str, Optional[str], str]:
+        """(severity, category, message, suggestion, rule_id) of the kind, as taken by __init__."""
+        _, _, _, message, suggestion = _VIOLATION_KINDS[self.kind]
+        return (self.severity, self.category, message, suggestion, self.rule_id)
+
+    def __reduce__(self):
+        # Kind codes are only meaningful in this process; pickle the values
+        return (Violation, (self.file_path, self.line_number, *self.details, self.detail))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Violation):
+            return NotImplemented
+        return (
+            (self.file_path, self.line_number, self.kind, self.detail)
+            == (other.file_path, other.line_number, other.kind, other.detail)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Violation(file_path={self.file_path!r}, line_number={self.line_number!r}, "
+            f"severity={self.severity!r}, category={self.category!r}, message={self.message!r}, "
+            f"suggestion={self.suggestion!r}, rule_id={self.rule_id!r})"
+        )
 
 
 @dataclass
@@ -52,7 +232,7 @@ class FileAnalysis:
 
     @property
     def has_errors(self) -> bool:
-        return any(v.severity == 'error' for v in self.violations)
+        return any(v.severity_level == SEVERITY_LEVELS['error'] for v in self.violations)
 
     @property
     def type_mismatch(self) -> bool:
@@ -129,6 +309,29 @@ ANTI_PATTERNS = {
 }
 
 
+# Numeric order of severities for --severity filtering
+SEVERITY_LEVELS = {'error': 3, 'warning': 2, 'info': 1}
+SEVERITY_NAMES = {level: severity for severity, level in SEVERITY_LEVELS.items()}
+
+# Severity of the violations raised by each content and structure rule, so
+# rules below the requested --severity are skipped instead of filtered later
+RULE_SEVERITIES = {
+    'frontmatter:type-mismatch': 'warning',
+    'forbidden': 'warning',
+    'required': 'info',
+    'structure:code_blocks': 'warning',
+    'structure:steps': 'warning',
+    'structure:prerequisites': 'info',
+}
+
+# The structure rule that applies to each Diataxis type
+STRUCTURE_RULES = {
+    'explanation': 'structure:code_blocks',
+    'reference': 'structure:steps',
+    'how-to': 'structure:prerequisites',
+}
+
+
 # Heuristics for inferring content type from actual content
 CONTENT_HEURISTICS = {
     'tutorial': {
@@ -146,14 +349,14 @@ CONTENT_HEURISTICS = {
             r'this guide shows',
             r'to (?:configure|enable|set up)',
             r'prerequisites?:',
-            r'(?:^|\n)## Prerequisites',
+            r'^## Prerequisites',
             r'follow these steps',
         ],
         'weight': 1.0,
     },
     'reference': {
         'indicators': [
-            r'(?:^|\n)## (?:Options|Parameters|Properties|Methods)',
+            r'^## (?:Options|Parameters|Properties|Methods)',
             r'\| .+ \| .+ \|',  # Tables
             r'returns?:',
             r'parameters?:',
@@ -174,57 +377,703 @@ CONTENT_HEURISTICS = {
 }
 
 
-def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, str]], int]:
-    """Extract YAML frontmatter from content. Returns (frontmatter_dict, end_line)."""
-    if not content.startswith('---\n'):
-        return None, 0
+# Document-level structure checks
+CODE_BLOCK_PATTERN = re.compile(r'```[\s\S]+?```')
+STEP_PATTERN = re.compile(r'(?:step \d+|first,|then,|finally,)', re.IGNORECASE)
+PREREQUISITES_PATTERN = re.compile(r'prerequisite|before you begin|you need', re.IGNORECASE)
+FRONTMATTER_END_PATTERN = re.compile(r'\n---\n')
+
+# Explanations with more fenced code blocks than this get a structure warning
+MAX_EXPLANATION_CODE_BLOCKS = 2
+
+# Files larger than this many bytes are analyzed line by line (see analyze_stream)
+STREAM_THRESHOLD = 1024 * 1024
+
+# Files read ahead of the one being analyzed (see read_ahead)
+READ_AHEAD = 8
+
+# Violations --fix can repair by adding frontmatter fields (see fix_document)
+FIXABLE_RULES = {'frontmatter:missing', 'frontmatter:missing-field', 'frontmatter:missing-type'}
+HEADING_PATTERN = re.compile(r'^# +(.+?) *$', re.MULTILINE)
+PLAIN_SCALAR_PATTERN = re.compile(r"[A-Za-z0-9][\w .,()'/-]*")
+
+# In streamed files, frontmatter must close within this many characters
+FRONTMATTER_HEAD_SIZE = 64 * 1024
+
+
+def required_literals(pattern: str) -> Optional[Set[str]]:
+    """Lowercase ASCII literals of which every match of a pattern contains one.
+
+    Walks the parsed pattern: runs of literal characters (zero-width
+    assertions such as \\b do not break a run), alternations whose every
+    branch has literals, and groups or repeats that must match at least
+    once. The candidate with the longest shortest literal wins. Returns
+    None if no such set exists (e.g. a pattern made only of classes), or
+    if the interpreter's regex parser is unavailable or not understood.
+    """
+    if sre_parse is None:
+        return None
+
+    repeats = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, 'POSSESSIVE_REPEAT', None)}
+
+    def sequence(items) -> Optional[Set[str]]:
+        best: Optional[Set[str]] = None
+        run: List[str] = []
+
+        def consider(literals: Optional[Set[str]]) -> None:
+            nonlocal best
+            if literals and all(literals):
+                if best is None or min(map(len, literals)) > min(map(len, best)):
+                    best = literals
+
+        def end_run() -> None:
+            if run:
+                consider({''.join(run)})
+                run.clear()
+
+        for op, av in items:
+            if op is sre_parse.LITERAL and av < 128:
+                run.append(chr(av).lower())
+            elif op is sre_parse.AT:
+                continue
+            else:
+                end_run()
+                if op is sre_parse.SUBPATTERN:
+                    consider(sequence(av[-1]))
+                elif op is sre_parse.BRANCH:
+                    branches = [sequence(branch) for branch in av[1]]
+                    if all(branches):
+                        consider(set().union(*branches))
+                elif op in repeats and av[0] >= 1:
+                    consider(sequence(av[2]))
+        end_run()
+        return best
 
-    # Find end of frontmatter
-    end_match = re.search(r'\n---\n', content[4:])
-    if not end_match:
-        return None, 0
+    try:
+        return sequence(sre_parse.parse(pattern))
+    except Exception:
+        return None
+
+
+def numbered_group_reference(pattern: str) -> Optional[str]:
+    """The first reference to a group by number in a pattern (\\1, (?(1)...)), if any.
+
+    Group numbers shift when a pattern is joined with others into one
+    regex, so such references would point at the wrong group.
+    """
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            if not in_class and pattern[index + 1:index + 2] in set('123456789'):
+                return pattern[index:index + 2]
+            index += 2
+            continue
+        if in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+            # A ']' right after '[' or '[^' is a literal, not the end
+            index += 1 + (pattern[index + 1:index + 2] == '^')
+            if pattern[index:index + 1] == ']':
+                index += 1
+            continue
+        elif pattern.startswith('(?(', index) and pattern[index + 3:index + 4].isdigit():
+            return pattern[index:pattern.find(')', index + 3) + 1]
+        index += 1
+    return None
 
-    end_pos = end_match.start() + 4
-    frontmatter_text = content[4:end_pos]
-    end_line = content[:end_pos + 4].count('\n')
 
-    # Parse frontmatter (simplified - doesn't handle complex YAML)
+def forbidden_matcher(patterns: List[str]) -> Pattern[str]:
+    """All forbidden phrases as one alternation; group 'rN' is pattern N."""
+    return re.compile(
+        '|'.join(f'(?P<r{i}>{pattern})' for i, pattern in enumerate(patterns)),
+        re.IGNORECASE | re.MULTILINE
+    )
+
+
+def required_matcher(patterns: List[str]) -> Pattern[str]:
+    """Any of a type's required elements, as one alternation."""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+def literal_alternation(literals: Iterable[str]) -> Pattern[str]:
+    """One regex matching any of the literals, with shared prefixes factored.
+
+    Only used to find where some literal occurs, so a literal that extends
+    a shorter one is dropped: the shorter one always matches first.
+    """
+    trie: Dict[str, Dict] = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        if '' in node:
+            return ''
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return re.compile(emit(trie))
+
+
+@dataclass
+class Prefilter:
+    """Literal prefilter for a list of rule patterns.
+
+    ``literals[i]`` holds the literals rule i needs (None if it needs none
+    and must always run). ``matcher`` finds any literal of any rule in one
+    scan, and is None unless every rule has literals. Both apply to
+    lowercased ASCII text only, where lowercasing is exact and keeps offsets;
+    callers fall back to the regexes for other text.
+    """
+    literals: List[Optional[List[str]]]
+    matcher: Optional[Pattern[str]]
+
+    def may_match(self, index: int, text_lower: str) -> bool:
+        """Whether rule ``index`` can match text containing ``text_lower``."""
+        literals = self.literals[index]
+        return literals is None or any(literal in text_lower for literal in literals)
+
+
+def build_prefilter(patterns: List[str]) -> Prefilter:
+    """Extract the literals of each pattern and combine them into a Prefilter."""
+    literals = []
+    for pattern in patterns:
+        found = required_literals(pattern)
+        literals.append(sorted(found) if found else None)
+
+    matcher = None
+    if literals and all(literals):
+        matcher = literal_alternation(chain.from_iterable(literals))
+    return Prefilter(literals=literals, matcher=matcher)
+
+
+@dataclass
+class CompiledRules:
+    """ANTI_PATTERNS rules for one Diataxis type, compiled once per run."""
+    content_type: str
+    forbidden: List[Tuple[Pattern[str], str]]
+    # All forbidden phrases as one alternation; group 'rN' is forbidden[N]
+    matcher: Optional[Pattern[str]]
+    required: Optional[Pattern[str]]
+    required_reason: Optional[str]
+    # Literal prefilters for the forbidden phrases and required elements
+    forbidden_prefilter: Prefilter
+    required_prefilter: Prefilter
+
+    def rule_index(self, match: Match[str]) -> int:
+        """Map a hit of the combined matcher back to its forbidden phrase."""
+        return int(match.lastgroup[1:])
+
+
+_COMPILED_RULES: Dict[str, CompiledRules] = {}
+
+
+def compile_rules(content_type: str) -> Optional[CompiledRules]:
+    """Compile (and cache) the anti-pattern rules for a Diataxis type."""
+    if content_type in _COMPILED_RULES:
+        return _COMPILED_RULES[content_type]
+
+    patterns = ANTI_PATTERNS.get(content_type)
+    if patterns is None:
+        return None
+
+    # MULTILINE makes '^' and '$' line anchors, so a phrase matches the same
+    # way whether the matcher runs on one line or on the whole document
+    phrases = patterns.get('forbidden_phrases', [])
+    forbidden = [
+        (re.compile(pattern, re.IGNORECASE | re.MULTILINE), reason)
+        for pattern, reason in phrases
+    ]
+    matcher = None
+    if phrases:
+        matcher = forbidden_matcher([pattern for pattern, _ in phrases])
+
+    elements = patterns.get('required_elements', [])
+    required = None
+    required_reason = None
+    if elements:
+        required = required_matcher([pattern for pattern, _ in elements])
+        required_reason = elements[0][1]
+
+    rules = CompiledRules(
+        content_type=content_type,
+        forbidden=forbidden,
+        matcher=matcher,
+        required=required,
+        required_reason=required_reason,
+        forbidden_prefilter=build_prefilter([pattern for pattern, _ in phrases]),
+        required_prefilter=build_prefilter([pattern for pattern, _ in elements]),
+    )
+    _COMPILED_RULES[content_type] = rules
+    return rules
+
+
+_COMPILED_HEURISTICS: List[Tuple[str, float, List[Pattern[str]]]] = []
+
+
+def compile_heuristics() -> List[Tuple[str, float, List[Pattern[str]]]]:
+    """Compile (and cache) the CONTENT_HEURISTICS indicators.
+
+    Indicators are compiled with MULTILINE so '^' anchors at line starts,
+    which keeps whole-document and line-by-line counts identical.
+    """
+    if not _COMPILED_HEURISTICS:
+        for content_type, config in CONTENT_HEURISTICS.items():
+            indicators = [
+                re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+                for pattern in config['indicators']
+            ]
+            _COMPILED_HEURISTICS.append((content_type, config['weight'], indicators))
+    return _COMPILED_HEURISTICS
+
+
+_HEURISTICS_PREFILTER: List[Prefilter] = []
+
+
+def heuristics_prefilter() -> Prefilter:
+    """Literal prefilter over every indicator, in compile_heuristics() order."""
+    if not _HEURISTICS_PREFILTER:
+        _HEURISTICS_PREFILTER.append(build_prefilter([
+            pattern.pattern
+            for _, _, indicators in compile_heuristics()
+            for pattern in indicators
+        ]))
+    return _HEURISTICS_PREFILTER[0]
+
+
+@dataclass
+class HeuristicWeights:
+    """Indicator weights for scoring rows of indicator counts.
+
+    A count row has one entry per indicator in compile_heuristics() order;
+    indicator i adds ``count * weights[i]`` to the score of
+    ``types[columns[i]]``. As a matrix this is (indicators x types), so
+    fit-weights scores its (documents x indicators) count matrix with one
+    product per epoch.
+    """
+    types: List[str]
+    columns: List[int]
+    weights: List[float]
+
+    @cached_property
+    def matrix(self) -> Any:
+        matrix = numpy.zeros((len(self.weights), len(self.types)))
+        matrix[numpy.arange(len(self.weights)), self.columns] = self.weights
+        return matrix
+
+    def score(self, row: List[int]) -> Optional[str]:
+        """The highest-scoring type (first on ties), or None if nothing scored."""
+        scores = [0.0] * len(self.types)
+        for count, column, weight in zip(row, self.columns, self.weights):
+            if count:
+                scores[column] += count * weight
+
+        best = max(scores)
+        return self.types[scores.index(best)] if best > 0 else None
+
+    def score_rows(self, rows: List[List[int]]) -> List[Optional[str]]:
+        """Score many count rows at once, with NumPy when it is installed."""
+        if numpy is None or not rows:
+            return [self.score(row) for row in rows]
+
+        scores = numpy.asarray(rows, dtype=float) @ self.matrix
+        best = scores.argmax(axis=1)
+        best_scores = scores[numpy.arange(len(rows)), best]
+        return [
+            self.types[column] if score > 0 else None
+            for column, score in zip(best.tolist(), best_scores.tolist())
+        ]
+
+
+_HEURISTIC_WEIGHTS: List[HeuristicWeights] = []
+
+
+def heuristic_weights() -> HeuristicWeights:
+    """Indicator weights from CONTENT_HEURISTICS.
+
+    Each indicator weighs its type's ``weight`` times its own entry in the
+    optional ``indicator_weights`` list (see the fit-weights command).
+    """
+    if not _HEURISTIC_WEIGHTS:
+        types, columns, weights = [], [], []
+        for column, (content_type, weight, indicators) in enumerate(compile_heuristics()):
+            types.append(content_type)
+            indicator_weights = CONTENT_HEURISTICS[content_type].get('indicator_weights')
+            for index in range(len(indicators)):
+                columns.append(column)
+                weights.append(weight * (indicator_weights[index] if indicator_weights else 1.0))
+        _HEURISTIC_WEIGHTS.append(HeuristicWeights(types=types, columns=columns, weights=weights))
+    return _HEURISTIC_WEIGHTS[0]
+
+
+def use_rules(anti_patterns: Dict[str, Dict], content_heuristics: Dict[str, Dict]) -> None:
+    """Make these the active ANTI_PATTERNS and CONTENT_HEURISTICS.
+
+    Also used as the worker process initializer, so workers check with the
+    same rules as the parent on every multiprocessing start method.
+    """
+    global ANTI_PATTERNS, CONTENT_HEURISTICS
+    ANTI_PATTERNS = anti_patterns
+    CONTENT_HEURISTICS = content_heuristics
+    _COMPILED_RULES.clear()
+    _COMPILED_HEURISTICS.clear()
+    _HEURISTICS_PREFILTER.clear()
+    _HEURISTIC_WEIGHTS.clear()
+
+
+def validate_rule_pack(pack: Any, source: str) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Check a parsed rule pack and normalize it to the built-in dict shapes.
+
+    Every pattern is compiled once here. Raises ValueError naming the first
+    problem found.
+    """
+    def fail(where: str, problem: str) -> None:
+        raise ValueError(f"{source}: {where}: {problem}")
+
+    def check_pattern(where: str, pattern: Any) -> str:
+        if not isinstance(pattern, str):
+            fail(where, 'pattern must be a string')
+        try:
+            re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+        except re.error as e:
+            fail(where, f"invalid pattern: {e}")
+        return pattern
+
+    def check_rules(where: str, entries: Any) -> List[Tuple[str, str]]:
+        # [[pattern, reason], ...] or [{pattern = ..., reason = ...}, ...]
+        if not isinstance(entries, list):
+            fail(where, 'must be a list')
+        rules = []
+        for index, entry in enumerate(entries):
+            if isinstance(entry, dict) and set(entry) == {'pattern', 'reason'}:
+                pattern, reason = entry['pattern'], entry['reason']
+            elif isinstance(entry, list) and len(entry) == 2:
+                pattern, reason = entry
+            else:
+                fail(f"{where}[{index}]", 'expected [pattern, reason] or {pattern, reason}')
+            if not isinstance(reason, str):
+                fail(f"{where}[{index}]", 'reason must be a string')
+            rules.append((check_pattern(f"{where}[{index}]", pattern), reason))
+        return rules
+
+    def check_combined(where: str, patterns: List[str], combine: Callable[[List[str]], Pattern[str]]) -> None:
+        # At run time a list of rules is matched as one alternation, where a
+        # pattern's groups are renumbered and its inline flags are no longer
+        # at the start; reject what would break or change meaning there
+        for index, pattern in enumerate(patterns):
+            reference = numbered_group_reference(pattern)
+            if reference is not None:
+                fail(
+                    f"{where}[{index}]",
+                    f"numbered group reference {reference} is not supported; "
+                    f"name the group with (?P<name>...) and refer to it with (?P=name)"
+                )
+            with warnings.catch_warnings():
+                # Python < 3.11 only warns about misplaced global flags
+                warnings.simplefilter('error', DeprecationWarning)
+                try:
+                    combine([pattern])
+                except (re.error, DeprecationWarning) as e:
+                    fail(f"{where}[{index}]", f"invalid pattern in a rule list: {e} (scope inline flags, e.g. (?s:...))")
+        try:
+            combine(patterns)
+        except re.error as e:
+            fail(where, f"patterns cannot be combined: {e}")
+
+    if not isinstance(pack, dict):
+        fail('rule pack', 'must be a table/object')
+    unknown = set(pack) - {'anti_patterns', 'content_heuristics'}
+    if unknown:
+        fail('rule pack', f"unknown key(s): {', '.join(sorted(unknown))}")
+
+    anti_patterns: Dict[str, Dict] = {}
+    for content_type, config in pack.get('anti_patterns', {}).items():
+        where = f"anti_patterns.{content_type}"
+        if content_type not in ANTI_PATTERNS:
+            fail(where, f"unknown Diataxis type (use one of: {', '.join(ANTI_PATTERNS)})")
+        if not isinstance(config, dict):
+            fail(where, 'must be a table/object')
+        rules: Dict[str, Any] = {}
+        for key, value in config.items():
+            if key in ('forbidden_phrases', 'required_elements'):
+                rules[key] = check_rules(f"{where}.{key}", value)
+                check_combined(
+                    f"{where}.{key}",
+                    [pattern for pattern, _ in rules[key]],
+                    forbidden_matcher if key == 'forbidden_phrases' else required_matcher
+                )
+            elif key == 'structure':
+                if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                    fail(f"{where}.{key}", 'must be a list of strings')
+                rules[key] = value
+            else:
+                fail(where, f"unknown key: {key}")
+        anti_patterns[content_type] = rules
+
+    content_heuristics: Dict[str, Dict] = {}
+    for content_type, config in pack.get('content_heuristics', {}).items():
+        where = f"content_heuristics.{content_type}"
+        if content_type not in CONTENT_HEURISTICS:
+            fail(where, f"unknown Diataxis type (use one of: {', '.join(CONTENT_HEURISTICS)})")
+        if not isinstance(config, dict):
+            fail(where, 'must be a table/object')
+        heuristics: Dict[str, Any] = {}
+        for key, value in config.items():
+            if key == 'indicators':
+                if not isinstance(value, list):
+                    fail(f"{where}.{key}", 'must be a list')
+                heuristics[key] = [
+                    check_pattern(f"{where}.{key}[{index}]", pattern)
+                    for index, pattern in enumerate(value)
+                ]
+            elif key == 'weight':
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                    fail(f"{where}.{key}", 'must be a non-negative number')
+                heuristics[key] = float(value)
+            elif key == 'indicator_weights':
+                if not isinstance(value, list) or not all(
+                    isinstance(item, (int, float)) and not isinstance(item, bool) and item >= 0
+                    for item in value
+                ):
+                    fail(f"{where}.{key}", 'must be a list of non-negative numbers')
+                heuristics[key] = [float(item) for item in value]
+            else:
+                fail(where, f"unknown key: {key}")
+        content_heuristics[content_type] = heuristics
+
+    return anti_patterns, content_heuristics
+
+
+def read_rule_pack(pack_path: Path, data: bytes) -> Any:
+    """Parse a TOML or JSON rule pack, chosen by file extension."""
+    if pack_path.suffix == '.toml':
+        if tomllib is None:
+            raise ValueError(f"{pack_path}: TOML rule packs need Python 3.11+; use a .json pack")
+        try:
+            return tomllib.loads(data.decode('utf-8'))
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+            raise ValueError(f"{pack_path}: {e}")
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        raise ValueError(f"{pack_path}: {e}")
+
+
+def load_rule_packs(
+    pack_paths: List[Path],
+    snapshot_path: Optional[Path] = None
+) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Merge rule packs over the built-in rules, in order.
+
+    Each type a pack mentions has the keys it gives replaced (e.g. a pack
+    with only ``anti_patterns.tutorial.forbidden_phrases`` keeps every other
+    built-in rule). The validated result is saved to ``snapshot_path``
+    keyed by a hash of the pack contents, so later runs with unchanged
+    packs skip parsing and validation. Compiled regexes cannot be stored,
+    so patterns are still compiled lazily, per type, as files need them.
+    Raises ValueError for unreadable or invalid packs.
+    """
+    # Built-in rules are part of the key: a pack only replaces some of them
+    digest = hashlib.sha256(rules_fingerprint().encode('utf-8'))
+    contents = []
+    for pack_path in pack_paths:
+        try:
+            data = pack_path.read_bytes()
+        except OSError as e:
+            raise ValueError(f"{pack_path}: {e}")
+        contents.append((pack_path, data))
+        digest.update(hashlib.sha256(data).digest())
+    key = digest.hexdigest()
+
+    if snapshot_path is not None:
+        try:
+            with open(snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('key') == key:
+                return snapshot['anti_patterns'], snapshot['content_heuristics']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+    anti_patterns = {content_type: dict(config) for content_type, config in ANTI_PATTERNS.items()}
+    content_heuristics = {content_type: dict(config) for content_type, config in CONTENT_HEURISTICS.items()}
+    for pack_path, data in contents:
+        pack_anti_patterns, pack_heuristics = validate_rule_pack(read_rule_pack(pack_path, data), str(pack_path))
+        for content_type, config in pack_anti_patterns.items():
+            anti_patterns[content_type].update(config)
+        for content_type, config in pack_heuristics.items():
+            content_heuristics[content_type].update(config)
+
+    for content_type, config in content_heuristics.items():
+        indicator_weights = config.get('indicator_weights')
+        if indicator_weights is not None and len(indicator_weights) != len(config['indicators']):
+            raise ValueError(
+                f"content_heuristics.{content_type}: {len(indicator_weights)} indicator_weights "
+                f"for {len(config['indicators'])} indicators"
+            )
+
+    if snapshot_path is not None:
+        try:
+            tmp_path = snapshot_path.with_name(snapshot_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'key': key,
+                    'anti_patterns': anti_patterns,
+                    'content_heuristics': content_heuristics,
+                }, f)
+            os.replace(tmp_path, snapshot_path)
+        except OSError as e:
+            print(f"Warning: could not write rule snapshot {snapshot_path}: {e}", file=sys.stderr)
+
+    return anti_patterns, content_heuristics
+
+
+def rule_enabled(rule: str, min_severity: int) -> bool:
+    """Whether a rule's violations are at or above the minimum severity."""
+    return SEVERITY_LEVELS[RULE_SEVERITIES[rule]] >= min_severity
+
+
+def infers_type(verbose: bool, min_severity: int) -> bool:
+    """Whether type inference is needed: for the mismatch check or to show it."""
+    return verbose or rule_enabled('frontmatter:type-mismatch', min_severity)
+
+
+def parse_frontmatter_lines(lines: Iterable[str]) -> Dict[str, str]:
+    """Parse frontmatter lines (simplified - doesn't handle complex YAML)."""
     frontmatter = {}
-    for line in frontmatter_text.split('\n'):
+    for line in lines:
         if ':' in line:
             key, value = line.split(':', 1)
             frontmatter[key.strip()] = value.strip()
+    return frontmatter
 
-    return frontmatter, end_line
 
+def frontmatter_end(content: str) -> Optional[int]:
+    """Offset of the newline before the closing '---', or None without frontmatter."""
+    if not content.startswith('---\n'):
+        return None
 
-def infer_content_type(content: str) -> Optional[str]:
-    """Infer the Diataxis type from content using heuristics."""
-    scores: Dict[str, float] = {
-        'tutorial': 0,
-        'how-to': 0,
-        'reference': 0,
-        'explanation': 0,
-    }
+    end_match = FRONTMATTER_END_PATTERN.search(content, 4)
+    return end_match.start() if end_match else None
 
-    content_lower = content.lower()
 
-    for content_type, config in CONTENT_HEURISTICS.items():
-        for pattern in config['indicators']:
-            matches = len(re.findall(pattern, content_lower, re.IGNORECASE))
-            scores[content_type] += matches * config['weight']
+def extract_frontmatter(content: str) -> Tuple[Optional[Dict[str, str]], int]:
+    """Extract YAML frontmatter from content. Returns (frontmatter_dict, end_line)."""
+    end_pos = frontmatter_end(content)
+    if end_pos is None:
+        return None, 0
 
-    if max(scores.values()) > 0:
-        return max(scores, key=scores.get)
+    frontmatter_text = content[4:end_pos]
+    end_line = content.count('\n', 0, end_pos + 4)
 
-    return None
+    return parse_frontmatter_lines(frontmatter_text.split('\n')), end_line
+
+
+@dataclass
+class ParsedDocument:
+    """An MDX file parsed once and shared by every check.
+
+    Frontmatter is parsed eagerly since every analysis needs the declared
+    type. The line table, fenced code spans and lowercase view are computed
+    on first use, so a check that does not need them costs nothing.
+    """
+    file_path: Path
+    content: str
+    frontmatter: Optional[Dict[str, str]] = None
+    # Offset of the first body character (0 without frontmatter)
+    body_offset: int = 0
+
+    @property
+    def declared_type(self) -> Optional[str]:
+        return self.frontmatter.get('diataxis_type') if self.frontmatter else None
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.content.split('\n')
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset of the first character of each line.
+
+        A final sentinel one past the end of the content means line N always
+        spans line_starts[N-1] up to line_starts[N] - 1.
+        """
+        return [0, *accumulate(len(line) + 1 for line in self.lines)]
+
+    def line_number(self, offset: int) -> int:
+        """1-based number of the line containing a character offset."""
+        return bisect_right(self.line_starts, offset)
+
+    @cached_property
+    def code_blocks(self) -> List[Tuple[int, int]]:
+        """(start, end) offsets of each fenced code block."""
+        return [match.span() for match in CODE_BLOCK_PATTERN.finditer(self.content)]
+
+    @cached_property
+    def lower(self) -> str:
+        return self.content.lower()
+
+
+def parse_document(file_path: Path, content: str) -> ParsedDocument:
+    """Parse decoded MDX content into a ParsedDocument."""
+    end_pos = frontmatter_end(content)
+    if end_pos is None:
+        return ParsedDocument(file_path=file_path, content=content)
+
+    frontmatter = parse_frontmatter_lines(content[4:end_pos].split('\n'))
+    return ParsedDocument(
+        file_path=file_path,
+        content=content,
+        frontmatter=frontmatter,
+        body_offset=end_pos + 5
+    )
+
+
+def score_indicator_counts(counts: List[List[int]]) -> Optional[str]:
+    """Pick the Diataxis type from per-indicator match counts.
+
+    ``counts`` is indexed like compile_heuristics(): one list per type, one
+    count per indicator.
+    """
+    return heuristic_weights().score(list(chain.from_iterable(counts)))
+
+
+def indicator_counts(doc: ParsedDocument) -> List[int]:
+    """Match count of every indicator, in compile_heuristics() order.
+
+    In ASCII documents an indicator is only run if one of its literals
+    occurs somewhere in the text.
+    """
+    content_lower = doc.lower
+    prefilter = heuristics_prefilter() if doc.content.isascii() else None
+
+    counts = []
+    for _, _, indicators in compile_heuristics():
+        for pattern in indicators:
+            if prefilter is None or prefilter.may_match(len(counts), content_lower):
+                counts.append(len(pattern.findall(content_lower)))
+            else:
+                counts.append(0)
+    return counts
+
+
+def infer_content_type(doc: ParsedDocument) -> Optional[str]:
+    """Infer the Diataxis type from content using heuristics."""
+    return heuristic_weights().score(indicator_counts(doc))
 
 
-def check_frontmatter(file_path: Path, content: str) -> List[Violation]:
+def check_frontmatter(doc: ParsedDocument) -> List[Violation]:
     """Check frontmatter for required Diataxis fields."""
-    violations = []
+    return frontmatter_violations(doc.file_path, doc.frontmatter)
+
 
-    frontmatter, _ = extract_frontmatter(content)
+def frontmatter_violations(file_path: Path, frontmatter: Optional[Dict[str, str]]) -> List[Violation]:
+    """Violations for missing or invalid frontmatter fields."""
+    violations = []
 
     if not frontmatter:
         violations.append(Violation(
@@ -233,7 +1082,8 @@ def check_frontmatter(file_path: Path, content: str) -> List[Violation]:
             severity='error',
             category='frontmatter',
             message='Missing YAML frontmatter',
-            suggestion='Add frontmatter with at least: title, description, diataxis_type'
+            suggestion='Add frontmatter with at least: title, description, diataxis_type',
+            rule_id='frontmatter:missing'
         ))
         return violations
 
@@ -247,7 +1097,8 @@ def check_frontmatter(file_path: Path, content: str) -> List[Violation]:
                 severity='error',
                 category='frontmatter',
                 message=f"Missing required field: {field}",
-                suggestion=f"Add '{field}: <value>' to frontmatter"
+                suggestion=f"Add '{field}: <value>' to frontmatter",
+                rule_id='frontmatter:missing-field'
             ))
 
     # Check for diataxis_type
@@ -258,7 +1109,8 @@ def check_frontmatter(file_path: Path, content: str) -> List[Violation]:
             severity='warning',
             category='frontmatter',
             message='Missing diataxis_type field',
-            suggestion="Add 'diataxis_type: tutorial|how-to|reference|explanation'"
+            suggestion="Add 'diataxis_type: tutorial|how-to|reference|explanation'",
+            rule_id='frontmatter:missing-type'
         ))
     else:
         diataxis_type = frontmatter['diataxis_type']
@@ -268,159 +1120,671 @@ def check_frontmatter(file_path: Path, content: str) -> List[Violation]:
                 line_number=1,
                 severity='error',
                 category='frontmatter',
-                message=f"Invalid diataxis_type: {diataxis_type}",
-                suggestion="Use one of: tutorial, how-to, reference, explanation"
+                message="Invalid diataxis_type: {detail}",
+                suggestion="Use one of: tutorial, how-to, reference, explanation",
+                rule_id='frontmatter:invalid-type',
+                detail=str(diataxis_type)
             ))
 
     return violations
 
 
-def check_content_patterns(
+def yaml_scalar(value: str) -> str:
+    """Frontmatter value, double-quoted unless it is plainly safe bare."""
+    if PLAIN_SCALAR_PATTERN.fullmatch(value):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def fix_document(doc: ParsedDocument, text: str) -> Optional[str]:
+    """Add missing frontmatter fields, or None if there is nothing to add.
+
+    ``text`` is the file as decoded, before newline translation; new lines
+    use its newline style and everything else is kept byte for byte. A
+    missing title comes from the first '# ' heading (or the file name) and
+    a missing diataxis_type is the inferred type when there is one. A
+    missing description is left to be written by hand and stays reported.
+    Existing values are never changed, even invalid ones.
+    """
+    frontmatter = doc.frontmatter or {}
+    fields = []
+    if 'title' not in frontmatter:
+        heading = HEADING_PATTERN.search(doc.content, doc.body_offset)
+        title = heading.group(1) if heading else doc.file_path.stem.replace('-', ' ').replace('_', ' ').capitalize()
+        fields.append(f"title: {yaml_scalar(title)}")
+    if 'diataxis_type' not in frontmatter:
+        inferred_type = infer_content_type(doc)
+        if inferred_type is not None:
+            fields.append(f"diataxis_type: {inferred_type}")
+    if not fields:
+        return None
+
+    newline = '\r\n' if '\r\n' in text else '\n'
+    added = ''.join(field + newline for field in fields)
+
+    end_pos = frontmatter_end(doc.content)
+    if end_pos is None:
+        return f"---{newline}{added}---{newline}{newline}{text}"
+
+    # Lines of the original text, numbered like the translated content
+    lines = re.split(r'(?<=\n)|(?<=\r)(?!\n)', text)
+    closing_line = doc.content.count('\n', 0, end_pos + 1)
+    return ''.join(lines[:closing_line]) + added + ''.join(lines[closing_line:])
+
+
+def fix_file(file_path: Path) -> Optional[Tuple[bytes, bytes]]:
+    """(original, fixed) bytes of a file, or None if it needs no fix."""
+    try:
+        data = file_path.read_bytes()
+        text = data.decode('utf-8')
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Warning: cannot fix {file_path}: {e}", file=sys.stderr)
+        return None
+
+    doc = parse_document(file_path, text.replace('\r\n', '\n').replace('\r', '\n'))
+    fixed = fix_document(doc, text)
+    if fixed is None:
+        return None
+    fixed_data = fixed.encode('utf-8')
+    return (data, fixed_data) if fixed_data != data else None
+
+
+def write_fix(file_path: Path, original: bytes, fixed: bytes) -> bool:
+    """Atomically replace a file's original bytes with fixed ones.
+
+    The file goes to a temporary sibling that then replaces it, so readers
+    (and file watchers) never see a half-written file. A file whose bytes
+    are no longer ``original`` is skipped rather than overwritten. Returns
+    whether the file was written.
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        if file_path.read_bytes() != original:
+            print(f"Warning: not fixing {file_path}: it changed during the run", file=sys.stderr)
+            return False
+        mode = file_path.stat().st_mode
+        with open(tmp_path, 'wb') as f:
+            f.write(fixed)
+        os.chmod(tmp_path, mode & 0o7777)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        print(f"Warning: could not fix {file_path}: {e}", file=sys.stderr)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        return False
+    return True
+
+
+def match_forbidden(rules: CompiledRules, line: str) -> Iterator[Tuple[int, Match[str]]]:
+    """Yield (rule index, leftmost match) for each forbidden phrase in a line.
+
+    The line is scanned once with the combined matcher. Only lines that hit
+    something are confirmed rule by rule, which keeps per-rule results
+    (one per rule and line, leftmost match as suggestion) exact.
+    """
+    first = rules.matcher.search(line)
+    if first is None:
+        return
+
+    first_index = rules.rule_index(first)
+    for index, (pattern, _) in enumerate(rules.forbidden):
+        match = first if index == first_index else pattern.search(line, first.start())
+        if match:
+            yield index, match
+
+
+def scan_forbidden(rules: CompiledRules, doc: ParsedDocument) -> Iterator[Tuple[int, int, Match[str]]]:
+    """Yield (line number, rule index, leftmost match) for a whole document.
+
+    One finder runs over the whole content rather than line by line: the
+    literal prefilter on the lowercased text of ASCII documents, otherwise
+    the combined matcher. Each hit is mapped to its line through the offset
+    index and confirmed on that line alone with match_forbidden, then the
+    search resumes at the next line, so results equal a per-line scan as
+    long as no phrase depends on the newline character.
+    """
+    content = doc.content
+    starts = doc.line_starts
+    finder, text = rules.matcher, content
+    if rules.forbidden_prefilter.matcher is not None and content.isascii():
+        finder, text = rules.forbidden_prefilter.matcher, doc.lower
+
+    pos = 0
+    while pos <= len(content):
+        first = finder.search(text, pos)
+        if first is None:
+            return
+
+        line_num = doc.line_number(first.start())
+        pos = starts[line_num]
+        for index, match in match_forbidden(rules, content[starts[line_num - 1]:pos - 1]):
+            yield line_num, index, match
+
+
+def forbidden_violation(
     file_path: Path,
-    content: str,
-    declared_type: Optional[str]
-) -> List[Violation]:
-    """Check content for anti-patterns based on declared type."""
+    line_number: int,
+    declared_type: str,
+    index: int,
+    reason: str,
+    match: Match[str]
+) -> Violation:
+    """Violation for forbidden phrase ``index`` found on a line."""
+    return Violation(
+        file_path=file_path,
+        line_number=line_number,
+        severity=RULE_SEVERITIES['forbidden'],
+        category='language',
+        message=f"Anti-pattern detected in {declared_type}: {reason}",
+        suggestion="Found: {detail}",
+        rule_id=f"{declared_type}:forbidden:{index}",
+        detail=match.group()
+    )
+
+
+def missing_required_violation(file_path: Path, rules: CompiledRules) -> Violation:
+    """Violation for a document without any of its type's required elements."""
+    return Violation(
+        file_path=file_path,
+        line_number=1,
+        severity=RULE_SEVERITIES['required'],
+        category='language',
+        message=f"Missing typical {rules.content_type} language patterns",
+        suggestion=rules.required_reason,
+        rule_id=f"{rules.content_type}:required"
+    )
+
+
+def required_present(rules: CompiledRules, doc: ParsedDocument) -> bool:
+    """Whether any required element occurs, skipping the regex if no literal does."""
+    prefilter = rules.required_prefilter.matcher
+    if prefilter is not None and doc.content.isascii() and not prefilter.search(doc.lower):
+        return False
+    return rules.required.search(doc.content) is not None
+
+
+def check_content_patterns(doc: ParsedDocument, min_severity: int = 0) -> List[Violation]:
+    """Check content for anti-patterns based on declared type.
+
+    Rules whose violations fall below ``min_severity`` are not run.
+    """
     violations = []
+    file_path = doc.file_path
+    declared_type = doc.declared_type
 
-    if not declared_type or declared_type not in ANTI_PATTERNS:
+    rules = compile_rules(declared_type) if declared_type else None
+    if rules is None:
         return violations
 
-    patterns = ANTI_PATTERNS[declared_type]
-    lines = content.split('\n')
+    # Check forbidden phrases, reported rule by rule
+    hits: List[List[Violation]] = [[] for _ in rules.forbidden]
+    if rules.matcher is not None and rule_enabled('forbidden', min_severity):
+        for line_num, index, match in scan_forbidden(rules, doc):
+            reason = rules.forbidden[index][1]
+            hits[index].append(forbidden_violation(file_path, line_num, declared_type, index, reason, match))
 
-    # Check forbidden phrases
-    for pattern, reason in patterns.get('forbidden_phrases', []):
-        for line_num, line in enumerate(lines, 1):
-            if re.search(pattern, line, re.IGNORECASE):
-                violations.append(Violation(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity='warning',
-                    category='language',
-                    message=f"Anti-pattern detected in {declared_type}: {reason}",
-                    suggestion=f"Found: {re.search(pattern, line, re.IGNORECASE).group()}"
-                ))
+    for rule_hits in hits:
+        violations.extend(rule_hits)
 
     # Check for required elements (at least one should be present)
-    required_found = False
-    for pattern, reason in patterns.get('required_elements', []):
-        if re.search(pattern, content, re.IGNORECASE):
-            required_found = True
-            break
-
-    if not required_found and patterns.get('required_elements'):
-        violations.append(Violation(
-            file_path=file_path,
-            line_number=1,
-            severity='info',
-            category='language',
-            message=f"Missing typical {declared_type} language patterns",
-            suggestion=patterns['required_elements'][0][1]
-        ))
+    if (
+        rules.required is not None and rule_enabled('required', min_severity)
+        and not required_present(rules, doc)
+    ):
+        violations.append(missing_required_violation(file_path, rules))
 
     return violations
 
 
-def check_structure(
+def check_structure(doc: ParsedDocument, min_severity: int = 0) -> List[Violation]:
+    """Check document structure for Diataxis compliance.
+
+    The structure rule is skipped if its severity is below ``min_severity``.
+    """
+    declared_type = doc.declared_type
+    rule = STRUCTURE_RULES.get(declared_type)
+    if rule is None or not rule_enabled(rule, min_severity):
+        return []
+
+    code_blocks = 0
+    code_blocks_line = 1
+    has_steps = False
+    steps_line = 1
+    has_prerequisites = True
+
+    if declared_type == 'explanation':
+        code_blocks = len(doc.code_blocks)
+        if code_blocks > MAX_EXPLANATION_CODE_BLOCKS:
+            code_blocks_line = doc.line_number(doc.code_blocks[MAX_EXPLANATION_CODE_BLOCKS][0])
+    elif declared_type == 'reference':
+        step = STEP_PATTERN.search(doc.content)
+        if step is not None:
+            has_steps = True
+            steps_line = doc.line_number(step.start())
+    elif declared_type == 'how-to':
+        has_prerequisites = PREREQUISITES_PATTERN.search(doc.content) is not None
+
+    return structure_violations(
+        doc.file_path, declared_type, code_blocks, has_steps, has_prerequisites,
+        code_blocks_line, steps_line
+    )
+
+
+def structure_violations(
     file_path: Path,
-    content: str,
-    declared_type: Optional[str]
+    declared_type: Optional[str],
+    code_blocks: int,
+    has_steps: bool,
+    has_prerequisites: bool,
+    code_blocks_line: int = 1,
+    steps_line: int = 1
 ) -> List[Violation]:
-    """Check document structure for Diataxis compliance."""
+    """Violations for the document-level structure facts of a file.
+
+    ``code_blocks_line`` is the line of the first code block over the limit
+    and ``steps_line`` the line of the first step marker.
+    """
     violations = []
 
     if not declared_type:
         return violations
 
     # Check for code blocks in explanations (usually inappropriate)
-    if declared_type == 'explanation':
-        code_blocks = re.findall(r'```[\s\S]+?```', content)
-        if len(code_blocks) > 2:
-            violations.append(Violation(
-                file_path=file_path,
-                line_number=1,
-                severity='warning',
-                category='structure',
-                message='Explanation has many code blocks - consider moving to how-to',
-                suggestion='Explanations should focus on concepts, not procedures'
-            ))
+    if declared_type == 'explanation' and code_blocks > MAX_EXPLANATION_CODE_BLOCKS:
+        violations.append(Violation(
+            file_path=file_path,
+            line_number=code_blocks_line,
+            severity=RULE_SEVERITIES['structure:code_blocks'],
+            category='structure',
+            message='Explanation has many code blocks - consider moving to how-to',
+            suggestion='Explanations should focus on concepts, not procedures',
+            rule_id='structure:code_blocks'
+        ))
 
     # Check for step-by-step in reference docs
-    if declared_type == 'reference':
-        step_pattern = r'(?:step \d+|first,|then,|finally,)'
-        if re.search(step_pattern, content, re.IGNORECASE):
-            violations.append(Violation(
-                file_path=file_path,
-                line_number=1,
-                severity='warning',
-                category='structure',
-                message='Reference doc has step-by-step instructions',
-                suggestion='Reference docs should be organized for lookup, not sequential reading'
-            ))
+    if declared_type == 'reference' and has_steps:
+        violations.append(Violation(
+            file_path=file_path,
+            line_number=steps_line,
+            severity=RULE_SEVERITIES['structure:steps'],
+            category='structure',
+            message='Reference doc has step-by-step instructions',
+            suggestion='Reference docs should be organized for lookup, not sequential reading',
+            rule_id='structure:steps'
+        ))
 
     # Check for missing prerequisites in how-to
-    if declared_type == 'how-to':
-        if not re.search(r'prerequisite|before you begin|you need', content, re.IGNORECASE):
-            violations.append(Violation(
-                file_path=file_path,
-                line_number=1,
-                severity='info',
-                category='structure',
-                message='How-to guide missing prerequisites section',
-                suggestion='Add a prerequisites section to set expectations'
-            ))
+    if declared_type == 'how-to' and not has_prerequisites:
+        violations.append(Violation(
+            file_path=file_path,
+            line_number=1,
+            severity=RULE_SEVERITIES['structure:prerequisites'],
+            category='structure',
+            message='How-to guide missing prerequisites section',
+            suggestion='Add a prerequisites section to set expectations',
+            rule_id='structure:prerequisites'
+        ))
 
     return violations
 
 
-def analyze_file(file_path: Path, verbose: bool = False) -> FileAnalysis:
-    """Analyze a single MDX file for Diataxis compliance."""
+def finish_analysis(analysis: FileAnalysis, verbose: bool = False) -> FileAnalysis:
+    """Add the checks that compare declared and inferred type."""
+    if analysis.type_mismatch:
+        analysis.violations.append(Violation(
+            file_path=analysis.file_path,
+            line_number=1,
+            severity=RULE_SEVERITIES['frontmatter:type-mismatch'],
+            category='frontmatter',
+            message=f"Type mismatch: declared as '{analysis.declared_type}' but content suggests '{analysis.inferred_type}'",
+            suggestion=f"Review content or update diataxis_type to '{analysis.inferred_type}'",
+            rule_id='frontmatter:type-mismatch'
+        ))
+
+    if verbose and analysis.inferred_type:
+        analysis.warnings.append(f"Inferred type: {analysis.inferred_type}")
+
+    return analysis
+
+
+class CodeBlockCounter:
+    """Count fenced code blocks line by line, like CODE_BLOCK_PATTERN.findall.
+
+    The opening line of the first ``keep`` blocks is kept in ``lines``.
+    """
+
+    def __init__(self, keep: int = MAX_EXPLANATION_CODE_BLOCKS + 1):
+        self.count = 0
+        self.open = False
+        self.open_line = 0
+        self.keep = keep
+        self.lines: List[int] = []
+
+    def feed(self, line: str, line_number: int = 0) -> None:
+        # A block needs at least one character between its fences; on a new
+        # line the newline itself satisfies that.
+        pos = 0
+        while True:
+            if not self.open:
+                start = line.find('```', pos)
+                if start < 0:
+                    return
+                self.open = True
+                self.open_line = line_number
+                pos = start + 4
+
+            end = line.find('```', pos)
+            if end < 0:
+                return
+            self.count += 1
+            if len(self.lines) < self.keep:
+                self.lines.append(self.open_line)
+            self.open = False
+            pos = end + 3
+
+
+def read_error(file_path: Path, error: Exception) -> FileAnalysis:
+    """Build the analysis reported for a file that cannot be read."""
     analysis = FileAnalysis(file_path=file_path)
+    analysis.violations.append(Violation(
+        file_path=file_path,
+        line_number=0,
+        severity='error',
+        category='file',
+        message="Error reading file: {detail}",
+        rule_id='file:read-error',
+        detail=str(error)
+    ))
+    return analysis
+
 
+class Profiler:
+    """Wall time and match counts per rule, check function and file.
+
+    Check functions and files are timed as part of the normal analysis.
+    Rules are timed in a separate pass that runs each pattern on its own,
+    since the combined matchers cannot attribute time to a single rule.
+    """
+
+    def __init__(self):
+        self.checks: Dict[str, float] = {}
+        # rule id -> [pattern, seconds, matches]
+        self.rules: Dict[str, List[Any]] = {}
+        self.files: List[Tuple[float, Path]] = []
+
+    @contextlib.contextmanager
+    def check(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.checks[name] = self.checks.get(name, 0.0) + time.perf_counter() - start
+
+    def add_rule(self, rule_id: str, pattern: Pattern[str], seconds: float, matches: int) -> None:
+        entry = self.rules.setdefault(rule_id, [pattern.pattern, 0.0, 0])
+        entry[1] += seconds
+        entry[2] += matches
+
+    def add_file(self, file_path: Path, seconds: float) -> None:
+        self.files.append((seconds, file_path))
+
+    def profile_rules(self, doc: ParsedDocument) -> None:
+        """Time every rule that applies to a document in isolation."""
+        content = doc.content
+        declared_type = doc.declared_type
+
+        def run(rule_id: str, pattern: Pattern[str], count: Callable[[Pattern[str]], int]) -> None:
+            start = time.perf_counter()
+            matches = count(pattern)
+            self.add_rule(rule_id, pattern, time.perf_counter() - start, matches)
+
+        content_lower = doc.lower
+        for content_type, _, indicators in compile_heuristics():
+            for index, pattern in enumerate(indicators):
+                run(f"heuristic:{content_type}:{index}", pattern,
+                    lambda p: len(p.findall(content_lower)))
+
+        rules = compile_rules(declared_type) if declared_type else None
+        if rules is not None:
+            lines = doc.lines
+            for index, (pattern, _) in enumerate(rules.forbidden):
+                run(f"{declared_type}:forbidden:{index}", pattern,
+                    lambda p: sum(1 for line in lines if p.search(line)))
+
+            elements = ANTI_PATTERNS[declared_type].get('required_elements', [])
+            for index, (element, _) in enumerate(elements):
+                run(f"{declared_type}:required:{index}", re.compile(element, re.IGNORECASE),
+                    lambda p: 1 if p.search(content) else 0)
+
+        structure = {
+            'explanation': ('code_blocks', CODE_BLOCK_PATTERN),
+            'reference': ('steps', STEP_PATTERN),
+            'how-to': ('prerequisites', PREREQUISITES_PATTERN),
+        }
+        if declared_type in structure:
+            name, pattern = structure[declared_type]
+            run(f"structure:{name}", pattern, lambda p: len(p.findall(content)))
+
+    def report(self, top: int = 10, out: TextIO = sys.stdout) -> None:
+        print(f"\n{'='*60}", file=out)
+        print("PROFILE", file=out)
+        print(f"{'='*60}", file=out)
+
+        print("Check functions:", file=out)
+        for name, seconds in sorted(self.checks.items(), key=lambda item: -item[1]):
+            print(f"  {seconds:9.4f}s  {name}", file=out)
+
+        print(f"\nSlowest rules (top {top}):", file=out)
+        ranked = sorted(self.rules.items(), key=lambda item: -item[1][1])[:top]
+        for rule_id, (pattern, seconds, matches) in ranked:
+            print(f"  {seconds:9.4f}s  {matches:8} match(es)  {rule_id}  {pattern}", file=out)
+
+        print(f"\nSlowest files (top {top}):", file=out)
+        for seconds, file_path in heapq.nlargest(top, self.files, key=lambda item: item[0]):
+            print(f"  {seconds:9.4f}s  {file_path}", file=out)
+
+
+def timed(profiler: Optional[Profiler], name: str) -> ContextManager[None]:
+    """Time a block under ``name`` when profiling; otherwise do nothing."""
+    return profiler.check(name) if profiler is not None else contextlib.nullcontext()
+
+
+def analyze_file(
+    file_path: Path,
+    verbose: bool = False,
+    stream_threshold: int = STREAM_THRESHOLD,
+    profiler: Optional[Profiler] = None,
+    min_severity: int = 0
+) -> FileAnalysis:
+    """Analyze a single MDX file for Diataxis compliance.
+
+    Files larger than ``stream_threshold`` bytes are streamed line by line
+    instead of being read into memory. Rules below ``min_severity`` are
+    skipped.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if file_path.stat().st_size > stream_threshold:
+            start = time.perf_counter()
+            with open(file_path, 'r', encoding='utf-8') as f, timed(profiler, 'analyze_stream'):
+                analysis = analyze_stream(file_path, f, verbose, min_severity)
+            if profiler is not None:
+                profiler.add_file(file_path, time.perf_counter() - start)
+            return analysis
+        data = file_path.read_bytes()
     except Exception as e:
-        analysis.violations.append(Violation(
-            file_path=file_path,
-            line_number=0,
-            severity='error',
-            category='file',
-            message=f"Error reading file: {e}"
-        ))
-        return analysis
+        return read_error(file_path, e)
+
+    return analyze_source(file_path, data, verbose, profiler, min_severity)
 
-    # Extract declared type from frontmatter
-    frontmatter, _ = extract_frontmatter(content)
-    if frontmatter and 'diataxis_type' in frontmatter:
-        analysis.declared_type = frontmatter['diataxis_type']
+
+def analyze_source(
+    file_path: Path,
+    data: bytes,
+    verbose: bool = False,
+    profiler: Optional[Profiler] = None,
+    min_severity: int = 0
+) -> FileAnalysis:
+    """Analyze the raw bytes of an MDX file for Diataxis compliance.
+
+    Rules below ``min_severity`` are skipped, and so is type inference
+    unless it is shown (verbose) or the type mismatch check needs it.
+    """
+    start = time.perf_counter()
+    try:
+        # Same decoding and newline translation as open(..., 'r')
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    except Exception as e:
+        return read_error(file_path, e)
+
+    analysis = FileAnalysis(file_path=file_path)
+
+    # Parse once; every check below shares the same document
+    with timed(profiler, 'parse_document'):
+        doc = parse_document(file_path, content)
+    analysis.declared_type = doc.declared_type
 
     # Infer type from content
-    analysis.inferred_type = infer_content_type(content)
+    if infers_type(verbose, min_severity):
+        with timed(profiler, 'infer_content_type'):
+            analysis.inferred_type = infer_content_type(doc)
 
     # Run checks
-    analysis.violations.extend(check_frontmatter(file_path, content))
-    analysis.violations.extend(check_content_patterns(file_path, content, analysis.declared_type))
-    analysis.violations.extend(check_structure(file_path, content, analysis.declared_type))
+    with timed(profiler, 'check_frontmatter'):
+        analysis.violations.extend(check_frontmatter(doc))
+    with timed(profiler, 'check_content_patterns'):
+        analysis.violations.extend(check_content_patterns(doc, min_severity))
+    with timed(profiler, 'check_structure'):
+        analysis.violations.extend(check_structure(doc, min_severity))
 
-    # Check for type mismatch
-    if analysis.type_mismatch:
-        analysis.violations.append(Violation(
-            file_path=file_path,
-            line_number=1,
-            severity='warning',
-            category='frontmatter',
-            message=f"Type mismatch: declared as '{analysis.declared_type}' but content suggests '{analysis.inferred_type}'",
-            suggestion=f"Review content or update diataxis_type to '{analysis.inferred_type}'"
-        ))
+    finish_analysis(analysis, verbose)
 
-    if verbose and analysis.inferred_type:
-        analysis.warnings.append(f"Inferred type: {analysis.inferred_type}")
+    if profiler is not None:
+        profiler.add_file(file_path, time.perf_counter() - start)
+        profiler.profile_rules(doc)
 
     return analysis
 
 
+def analyze_stream(
+    file_path: Path,
+    lines: Iterable[str],
+    verbose: bool = False,
+    min_severity: int = 0
+) -> FileAnalysis:
+    """Analyze an MDX file from an iterator of newline-terminated lines.
+
+    Only the frontmatter head is buffered, and it must close within
+    FRONTMATTER_HEAD_SIZE characters. Every other line is checked as it
+    streams past and document-level heuristics are updated incrementally,
+    so memory does not grow with the file. Results match analyze_source as
+    long as no rule pattern spans lines.
+    """
+    analysis = FileAnalysis(file_path=file_path)
+    lines = iter(lines)
+
+    # Frontmatter: a '---' first line closed by a later '---' line
+    head: List[str] = []
+    head_size = 0
+    frontmatter = None
+    for line in lines:
+        head.append(line)
+        head_size += len(line)
+        if head[0] != '---\n' or head_size > FRONTMATTER_HEAD_SIZE:
+            break
+        if len(head) > 2 and line == '---\n':
+            frontmatter = parse_frontmatter_lines(l[:-1] for l in head[1:-1])
+            break
+
+    if frontmatter and 'diataxis_type' in frontmatter:
+        analysis.declared_type = frontmatter['diataxis_type']
+    declared_type = analysis.declared_type
+
+    def body() -> Iterator[str]:
+        # Lines without their newline, exactly as content.split('\n') gives them
+        last = '\n'
+        for line in chain(head, lines):
+            last = line
+            yield line[:-1] if line.endswith('\n') else line
+        if last.endswith('\n'):
+            yield ''
+
+    # Rules below min_severity are skipped, as in analyze_source
+    infer = infers_type(verbose, min_severity)
+    heuristics = compile_heuristics()
+    counts = [[0] * len(indicators) for _, _, indicators in heuristics]
+
+    rules = compile_rules(declared_type) if declared_type else None
+    hits: List[List[Violation]] = [[] for _ in rules.forbidden] if rules else []
+    check_forbidden = rules is not None and rules.matcher is not None and rule_enabled('forbidden', min_severity)
+    required_found = not rule_enabled('required', min_severity)
+
+    structure_rule = STRUCTURE_RULES.get(declared_type)
+    check_shape = structure_rule is not None and rule_enabled(structure_rule, min_severity)
+    code_blocks = CodeBlockCounter()
+    has_steps = False
+    steps_line = 1
+    has_prerequisites = not check_shape
+
+    # Lines without any prefilter literal skip the regexes; only ASCII lines
+    # are prefiltered, as in analyze_source
+    heuristic_literals = heuristics_prefilter().matcher
+    forbidden_literals = rules.forbidden_prefilter.matcher if rules is not None else None
+
+    for line_num, line in enumerate(body(), 1):
+        line_lower = line.lower()
+        ascii_line = line.isascii()
+
+        if infer and not (ascii_line and heuristic_literals and not heuristic_literals.search(line_lower)):
+            for type_counts, (_, _, indicators) in zip(counts, heuristics):
+                for index, pattern in enumerate(indicators):
+                    type_counts[index] += len(pattern.findall(line_lower))
+
+        if check_forbidden and not (ascii_line and forbidden_literals and not forbidden_literals.search(line_lower)):
+            for index, match in match_forbidden(rules, line):
+                reason = rules.forbidden[index][1]
+                hits[index].append(forbidden_violation(file_path, line_num, declared_type, index, reason, match))
+        if not required_found and rules is not None and rules.required is not None:
+            required_found = rules.required.search(line) is not None
+
+        if check_shape:
+            if declared_type == 'explanation':
+                code_blocks.feed(line, line_num)
+            elif declared_type == 'reference' and not has_steps:
+                has_steps = STEP_PATTERN.search(line) is not None
+                steps_line = line_num
+            elif declared_type == 'how-to' and not has_prerequisites:
+                has_prerequisites = PREREQUISITES_PATTERN.search(line) is not None
+
+    if infer:
+        analysis.inferred_type = score_indicator_counts(counts)
+
+    # Same order as analyze_source
+    analysis.violations.extend(frontmatter_violations(file_path, frontmatter))
+    if rules is not None:
+        for rule_hits in hits:
+            analysis.violations.extend(rule_hits)
+        if rules.required is not None and not required_found:
+            analysis.violations.append(missing_required_violation(file_path, rules))
+    code_blocks_line = 1
+    if code_blocks.count > MAX_EXPLANATION_CODE_BLOCKS:
+        code_blocks_line = code_blocks.lines[MAX_EXPLANATION_CODE_BLOCKS]
+    analysis.violations.extend(structure_violations(
+        file_path, declared_type, code_blocks.count, has_steps, has_prerequisites,
+        code_blocks_line, steps_line
+    ))
+
+    return finish_analysis(analysis, verbose)
+
+
+def file_digest(file_path: Path) -> str:
+    """SHA-256 of a file, read in bounded chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def format_violation_report(analysis: FileAnalysis, verbose: bool = False) -> str:
     """Format violation report for display."""
     if not analysis.violations and not verbose:
@@ -436,78 +1800,948 @@ def format_violation_report(analysis: FileAnalysis, verbose: bool = False) -> st
     if analysis.violations:
         lines.append(f"  {len(analysis.violations)} violation(s):")
 
-        # Group by severity
-        errors = [v for v in analysis.violations if v.severity == 'error']
-        warnings = [v for v in analysis.violations if v.severity == 'warning']
-        infos = [v for v in analysis.violations if v.severity == 'info']
-
-        for severity, violations in [('ERROR', errors), ('WARNING', warnings), ('INFO', infos)]:
-            for v in violations:
-                lines.append(f"    [{severity}] Line {v.line_number}: {v.message}")
-                if verbose and v.suggestion:
-                    lines.append(f"      → {v.suggestion}")
+        # Group by severity, most severe first (the sort is stable)
+        for v in sorted(analysis.violations, key=lambda v: -v.severity_level):
+            lines.append(f"    [{v.severity.upper()}] Line {v.line_number}: {v.message}")
+            if verbose and v.suggestion:
+                lines.append(f"      → {v.suggestion}")
 
     return '\n'.join(lines)
 
 
-def scan_directory(base_path: Path, verbose: bool = False) -> List[FileAnalysis]:
-    """Scan directory for MDX files and analyze each."""
-    results = []
+class ResultCache:
+    """Persistent per-file analysis cache keyed by content hash and rule set.
+
+    Entries are stored per file path together with the SHA-256 of the bytes
+    they were computed from. The whole cache is discarded when the rule set
+    fingerprint changes, and entries for files that no longer exist are
+    dropped on save. Violations are stored as [line, kind] pairs indexing a
+    shared table of [severity, category, message, suggestion, rule_id],
+    followed by the violation's detail if it has one.
+
+    Each entry also records the minimum severity it was computed for and
+    whether the type was inferred, since skipped rules leave it incomplete
+    for a run that wants more.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fingerprint = rules_fingerprint()
+        self.entries: Dict[str, Dict] = {}
+        self.kinds: List[List[Any]] = []
+        self.kind_codes: Dict[Tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(stored, dict) and stored.get('fingerprint') == self.fingerprint:
+            self.entries = stored.get('entries', {})
+            self.kinds = stored.get('kinds', [])
+            self.kind_codes = {tuple(kind): code for code, kind in enumerate(self.kinds)}
+
+    def kind_code(self, violation: Violation) -> int:
+        details = violation.details
+        code = self.kind_codes.get(details)
+        if code is None:
+            code = self.kind_codes[details] = len(self.kinds)
+            self.kinds.append(list(details))
+        return code
+
+    def get(
+        self,
+        file_path: Path,
+        digest: str,
+        verbose: bool = False,
+        min_severity: int = 0
+    ) -> Optional[FileAnalysis]:
+        """Replay the cached analysis for a file if its content is unchanged."""
+        entry = self.entries.get(str(file_path.resolve()))
+        if (
+            entry is None or entry['sha256'] != digest
+            or entry.get('min_severity', 0) > min_severity
+            or (infers_type(verbose, min_severity) and not entry.get('inferred', True))
+        ):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        analysis = FileAnalysis(
+            file_path=file_path,
+            declared_type=entry['declared_type'],
+            inferred_type=entry['inferred_type'],
+            violations=[
+                Violation(file_path, line_number, *self.kinds[kind], *detail)
+                for line_number, kind, *detail in entry['violations']
+            ],
+        )
+        if verbose and analysis.inferred_type:
+            analysis.warnings.append(f"Inferred type: {analysis.inferred_type}")
+        return analysis
+
+    def put(
+        self,
+        file_path: Path,
+        digest: str,
+        analysis: FileAnalysis,
+        verbose: bool = False,
+        min_severity: int = 0
+    ) -> None:
+        """Record the analysis computed for a file's current content."""
+        self.entries[str(file_path.resolve())] = {
+            'sha256': digest,
+            'min_severity': min_severity,
+            'inferred': infers_type(verbose, min_severity),
+            'declared_type': analysis.declared_type,
+            'inferred_type': analysis.inferred_type,
+            'violations': [
+                [v.line_number, self.kind_code(v)] + ([] if v.detail is None else [v.detail])
+                for v in analysis.violations
+            ],
+        }
+
+    def save(self) -> None:
+        """Evict entries for deleted files and write the cache atomically."""
+        self.entries = {
+            path: entry for path, entry in self.entries.items()
+            if os.path.exists(path)
+        }
+
+        # Renumber the kind table so kinds only evicted entries used are dropped
+        kinds: List[List[Any]] = []
+        codes: Dict[int, int] = {}
+        for entry in self.entries.values():
+            for violation in entry['violations']:
+                kind = violation[1]
+                if kind not in codes:
+                    codes[kind] = len(kinds)
+                    kinds.append(self.kinds[kind])
+                violation[1] = codes[kind]
+        self.kinds = kinds
+        self.kind_codes = {tuple(kind): code for code, kind in enumerate(kinds)}
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': self.fingerprint, 'kinds': self.kinds, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not write cache {self.path}: {e}", file=sys.stderr)
+
+
+def rules_fingerprint() -> str:
+    """Hash of everything that affects analysis results."""
+    rules = {
+        'version': CHECKER_VERSION,
+        'anti_patterns': ANTI_PATTERNS,
+        'content_heuristics': CONTENT_HEURISTICS,
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+_Scheduled = Tuple[Path, Optional[str], Union[FileAnalysis, 'Future[FileAnalysis]']]
+
+# Raw bytes (None for streamed files) and digest (None without a cache)
+_Loaded = Tuple[Optional[bytes], Optional[str]]
+
+
+def read_ahead(
+    files: List[Path],
+    read: Callable[[Path], _Loaded],
+    depth: int = READ_AHEAD
+) -> Iterator[Tuple[Path, 'Future[_Loaded]']]:
+    """Yield (file, future of read(file)) in order, reading ahead on threads.
+
+    Up to ``depth`` files beyond the one being consumed are read in the
+    background, so slow storage overlaps with analysis while memory stays
+    bounded. With ``depth`` 0 each file is read only when it is reached.
+    """
+    if depth < 1:
+        for file_path in files:
+            future: 'Future[_Loaded]' = Future()
+            try:
+                future.set_result(read(file_path))
+            except Exception as e:
+                future.set_exception(e)
+            yield file_path, future
+        return
+
+    pending: Deque[Tuple[Path, 'Future[_Loaded]']] = deque()
+    with ThreadPoolExecutor(max_workers=min(depth, 4)) as pool:
+        try:
+            for file_path in files:
+                pending.append((file_path, pool.submit(read, file_path)))
+                if len(pending) > depth:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            # Don't read files nobody will analyze if the caller stops early
+            for _, future in pending:
+                future.cancel()
+
+
+def analyze_files(
+    files: List[Path],
+    verbose: bool = False,
+    jobs: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    stream_threshold: int = STREAM_THRESHOLD,
+    profiler: Optional[Profiler] = None,
+    min_severity: int = 0,
+    read_ahead_depth: int = READ_AHEAD
+) -> Iterator[FileAnalysis]:
+    """Analyze files across ``jobs`` worker processes, yielding in order.
+
+    At most a few files per worker are in flight at once, so results stream
+    out as they complete without the whole run being held in memory. With a
+    cache, each file is read and hashed here and only files whose content
+    changed are sent to the workers. Profiling runs every file in this
+    process and without the cache, so that all analysis time is measured.
+
+    Files read in this process (with a cache, or without workers) are read
+    up to ``read_ahead_depth`` files ahead on background threads.
+    """
+    if profiler is not None:
+        jobs = 1
+        cache = None
+
+    jobs = min(jobs or os.cpu_count() or 1, len(files))
+    executor = None
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=use_rules,
+            initargs=(ANTI_PATTERNS, CONTENT_HEURISTICS)
+        )
+    window = jobs * 4 if executor is not None else 0
 
-    mdx_files = sorted(base_path.rglob('*.mdx'))
-    print(f"Found {len(mdx_files)} .mdx file(s) to analyze...")
+    # (file, digest to cache under, analysis or pending future)
+    pending: Deque[_Scheduled] = deque()
 
-    for file_path in mdx_files:
-        if verbose:
-            print(f"Analyzing: {file_path.relative_to(base_path)}")
+    def finish() -> FileAnalysis:
+        file_path, digest, result = pending.popleft()
+        analysis = result.result() if isinstance(result, Future) else result
+        if digest is not None:
+            cache.put(file_path, digest, analysis, verbose, min_severity)
+        return analysis
 
-        analysis = analyze_file(file_path, verbose)
-        results.append(analysis)
+    def run(func: Callable[..., FileAnalysis], *func_args) -> Union[FileAnalysis, 'Future[FileAnalysis]']:
+        if executor is None:
+            return func(*func_args)
+        return executor.submit(func, *func_args)
+
+    def load(file_path: Path) -> _Loaded:
+        if file_path.stat().st_size > stream_threshold:
+            # Too large to hold in memory; analyze_file streams it itself
+            return None, file_digest(file_path) if cache is not None else None
+        data = file_path.read_bytes()
+        return data, hashlib.sha256(data).hexdigest() if cache is not None else None
+
+    def schedule(file_path: Path, loaded: Optional['Future[_Loaded]']) -> _Scheduled:
+        if loaded is None:
+            return file_path, None, run(analyze_file, file_path, verbose, stream_threshold, None, min_severity)
+
+        try:
+            data, digest = loaded.result()
+        except Exception as e:
+            return file_path, None, read_error(file_path, e)
+
+        if digest is not None:
+            cached = cache.get(file_path, digest, verbose, min_severity)
+            if cached is not None:
+                return file_path, None, cached
+        if data is None:
+            return file_path, digest, run(analyze_file, file_path, verbose, stream_threshold, profiler, min_severity)
+        return file_path, digest, run(analyze_source, file_path, data, verbose, profiler, min_severity)
+
+    if executor is not None and cache is None:
+        # Workers read their own files, so reads already overlap
+        sources: Iterator[Tuple[Path, Optional['Future[_Loaded]']]] = ((f, None) for f in files)
+    else:
+        sources = read_ahead(files, load, read_ahead_depth)
 
-    return results
+    try:
+        for file_path, loaded in sources:
+            pending.append(schedule(file_path, loaded))
+            while len(pending) > window:
+                yield finish()
+
+        while pending:
+            yield finish()
+    finally:
+        sources.close()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def changed_files(path: Path, ref: str) -> List[Path]:
+    """List .mdx files under path added, modified or renamed since a git ref.
+
+    Compares ``ref`` with the working tree, so uncommitted edits count, and
+    also includes untracked files. Deleted files are never returned.
+    """
+    cwd = path if path.is_dir() else path.parent
+
+    def git(*git_args: str) -> List[str]:
+        output = subprocess.run(
+            ['git', *git_args],
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        return [name for name in output.split('\0') if name]
+
+    root = Path(git('rev-parse', '--show-toplevel')[0].strip())
+    pathspec = str(path.resolve())
+    names = git('diff', '--name-only', '-z', '--diff-filter=AMR', ref, '--', pathspec)
+    names += git('ls-files', '-z', '--others', '--exclude-standard', '--full-name', '--', pathspec)
+
+    files = {root / name for name in names if name.endswith('.mdx')}
+    return sorted(f for f in files if f.is_file())
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an 'i/N' shard spec (1-based) for argparse."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got '{value}'")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index must be between 1 and N, got '{value}'")
+    return index, count
+
+
+def shard_files(files: List[Path], base_path: Path, index: int, count: int) -> List[Path]:
+    """Keep the files that belong to shard ``index`` of ``count`` (1-based).
+
+    Files are assigned by a stable hash of their path relative to base_path,
+    so every node computes the same split and each file lands on exactly
+    one shard.
+    """
+    base = base_path.resolve()
+
+    def shard_of(file_path: Path) -> int:
+        relative = file_path.resolve().relative_to(base).as_posix()
+        digest = hashlib.sha256(relative.encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') % count
+
+    return [f for f in files if shard_of(f) == index - 1]
+
+
+def scan_directory(
+    base_path: Path,
+    verbose: bool = False,
+    jobs: Optional[int] = None,
+    cache: Optional[ResultCache] = None,
+    files: Optional[List[Path]] = None,
+    stream_threshold: int = STREAM_THRESHOLD,
+    log: Callable[[str], None] = print,
+    profiler: Optional[Profiler] = None,
+    min_severity: int = 0,
+    read_ahead_depth: int = READ_AHEAD
+) -> Iterator[FileAnalysis]:
+    """Scan directory for MDX files and yield the analysis of each.
+
+    Files are fanned out to ``jobs`` worker processes (default: one per CPU);
+    analyses are always yielded in sorted path order. Pass ``files`` to
+    analyze only those files instead of every .mdx under base_path. Progress
+    messages go through ``log``.
+    """
+    mdx_files = sorted(base_path.rglob('*.mdx')) if files is None else sorted(files)
+    log(f"Found {len(mdx_files)} .mdx file(s) to analyze...")
+
+    analyses = analyze_files(
+        mdx_files, verbose, jobs, cache, stream_threshold, profiler, min_severity, read_ahead_depth
+    )
+    try:
+        for file_path, analysis in zip(mdx_files, analyses):
+            if verbose:
+                log(f"Analyzing: {file_path.relative_to(base_path)}")
+            yield analysis
+    finally:
+        # Stop the workers promptly if the caller stops early
+        analyses.close()
+
+
+def watch_directory(
+    path: Path,
+    verbose: bool = False,
+    min_severity: int = 0,
+    interval: float = 0.5,
+    jobs: Optional[int] = None,
+    cache: Optional[ResultCache] = None
+) -> None:
+    """Poll path for changes and print violations that appear or go away.
+
+    Files are re-analyzed only when their mtime or size changes and their
+    content hash differs from the last analyzed version. Runs until
+    interrupted.
+    """
+    base_path = path if path.is_dir() else path.parent
+
+    def list_files() -> List[Path]:
+        return [path] if path.is_file() else sorted(path.rglob('*.mdx'))
+
+    # Violations are compared as (line, interned kind, detail), and reported
+    # as the Violation first seen with that key
+    def violation_set(analysis: FileAnalysis) -> Dict[Tuple[int, int, Optional[str]], Violation]:
+        return {
+            (v.line_number, v.kind, v.detail): v
+            for v in analysis.violations
+            if v.severity_level >= min_severity
+        }
+
+    def sort_key(v: Violation) -> Tuple:
+        return (v.line_number, v.severity, v.category, v.message)
+
+    def describe(v: Violation) -> str:
+        text = f"[{v.severity.upper()}] Line {v.line_number}: {v.message}"
+        if verbose and v.suggestion:
+            text += f" ({v.suggestion})"
+        return text
+
+    stats: Dict[Path, Tuple[int, int]] = {}
+    digests: Dict[Path, str] = {}
+    known: Dict[Path, Dict[Tuple[int, int, Optional[str]], Violation]] = {}
+
+    # Only stat before the first analysis, which reads each file once; the
+    # content hash of a file is taken the first time its mtime changes, and
+    # an unchanged result then just yields no added or resolved violations
+    files = list_files()
+    for file_path in files:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+
+    analyses = analyze_files(files, verbose, jobs, cache, min_severity=min_severity)
+    for file_path, analysis in zip(files, analyses):
+        known[file_path] = violation_set(analysis)
+
+    total = sum(len(v) for v in known.values())
+    print(f"Watching {len(files)} .mdx file(s) with {total} violation(s). Press Ctrl+C to stop.")
 
+    try:
+        while True:
+            time.sleep(interval)
+            files = list_files()
+
+            changes: List[Tuple[Path, List[Violation], List[Violation]]] = []
+            for file_path in set(known) - set(files):
+                changes.append((file_path, [], list(known.pop(file_path).values())))
+                stats.pop(file_path, None)
+                digests.pop(file_path, None)
+
+            for file_path in files:
+                try:
+                    stat = file_path.stat()
+                    if stats.get(file_path) == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    data = file_path.read_bytes()
+                except OSError:
+                    continue
+
+                stats[file_path] = (stat.st_mtime_ns, stat.st_size)
+                digest = hashlib.sha256(data).hexdigest()
+                if digests.get(file_path) == digest:
+                    continue
+                digests[file_path] = digest
+
+                analysis = analyze_source(file_path, data, verbose, min_severity=min_severity)
+                if cache is not None:
+                    cache.put(file_path, digest, analysis, verbose, min_severity)
+
+                current = violation_set(analysis)
+                previous = known.get(file_path, {})
+                known[file_path] = current
+                changes.append((
+                    file_path,
+                    [v for key, v in current.items() if key not in previous],
+                    [v for key, v in previous.items() if key not in current],
+                ))
 
-def print_summary(results: List[FileAnalysis]) -> None:
-    """Print summary statistics."""
-    total_files = len(results)
-    files_with_errors = sum(1 for r in results if r.has_errors)
-    files_with_violations = sum(1 for r in results if r.violations)
-    total_violations = sum(len(r.violations) for r in results)
+            for file_path, added, resolved in sorted(changes, key=lambda c: c[0]):
+                if not added and not resolved:
+                    continue
+                print(f"\n[{time.strftime('%H:%M:%S')}] {file_path.relative_to(base_path)}")
+                for v in sorted(resolved, key=sort_key):
+                    print(f"  - {describe(v)}")
+                for v in sorted(added, key=sort_key):
+                    print(f"  + {describe(v)}")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
 
-    type_mismatches = sum(1 for r in results if r.type_mismatch)
 
+@dataclass
+class Summary:
+    """Running totals for the end-of-run summary, updated once per file."""
+    total_files: int = 0
+    files_with_violations: int = 0
+    files_with_errors: int = 0
+    total_violations: int = 0
+    type_mismatches: int = 0
+    # False when --severity skipped type inference, so mismatches were not counted
+    type_checked: bool = True
+    severity_counts: Dict[str, int] = field(
+        default_factory=lambda: {'error': 0, 'warning': 0, 'info': 0}
+    )
+    type_counts: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, analysis: FileAnalysis) -> None:
+        """Fold one file's analysis into the totals."""
+        self.total_files += 1
+        self.total_violations += len(analysis.violations)
+
+        if analysis.violations:
+            self.files_with_violations += 1
+        if analysis.has_errors:
+            self.files_with_errors += 1
+        if analysis.type_mismatch:
+            self.type_mismatches += 1
+
+        for v in analysis.violations:
+            if v.severity in self.severity_counts:
+                self.severity_counts[v.severity] += 1
+
+        if analysis.declared_type:
+            self.type_counts[analysis.declared_type] = self.type_counts.get(analysis.declared_type, 0) + 1
+
+    def combine(self, other: 'Summary') -> None:
+        """Fold another run's totals (e.g. a shard) into these."""
+        self.total_files += other.total_files
+        self.files_with_violations += other.files_with_violations
+        self.files_with_errors += other.files_with_errors
+        self.total_violations += other.total_violations
+        self.type_mismatches += other.type_mismatches
+        self.type_checked = self.type_checked and other.type_checked
+
+        for severity, count in other.severity_counts.items():
+            self.severity_counts[severity] = self.severity_counts.get(severity, 0) + count
+        for dtype, count in other.type_counts.items():
+            self.type_counts[dtype] = self.type_counts.get(dtype, 0) + count
+
+
+def print_summary(summary: Summary) -> None:
+    """Print summary statistics."""
     print(f"\n{'='*60}")
     print("SUMMARY")
     print(f"{'='*60}")
-    print(f"Total files analyzed: {total_files}")
-    print(f"Files with violations: {files_with_violations}")
-    print(f"Files with errors: {files_with_errors}")
-    print(f"Total violations: {total_violations}")
-    print(f"Type mismatches: {type_mismatches}")
+    print(f"Total files analyzed: {summary.total_files}")
+    print(f"Files with violations: {summary.files_with_violations}")
+    print(f"Files with errors: {summary.files_with_errors}")
+    print(f"Total violations: {summary.total_violations}")
+    if summary.type_checked:
+        print(f"Type mismatches: {summary.type_mismatches}")
+    else:
+        print("Type mismatches: not checked (type inference is skipped at this --severity)")
 
     # Count by severity
-    errors = sum(sum(1 for v in r.violations if v.severity == 'error') for r in results)
-    warnings = sum(sum(1 for v in r.violations if v.severity == 'warning') for r in results)
-    infos = sum(sum(1 for v in r.violations if v.severity == 'info') for r in results)
-
     print(f"\nBy severity:")
-    print(f"  Errors: {errors}")
-    print(f"  Warnings: {warnings}")
-    print(f"  Info: {infos}")
+    print(f"  Errors: {summary.severity_counts['error']}")
+    print(f"  Warnings: {summary.severity_counts['warning']}")
+    print(f"  Info: {summary.severity_counts['info']}")
 
     # Type distribution
-    type_counts: Dict[str, int] = {}
-    for r in results:
-        if r.declared_type:
-            type_counts[r.declared_type] = type_counts.get(r.declared_type, 0) + 1
-
-    if type_counts:
+    if summary.type_counts:
         print(f"\nDiataxis type distribution:")
-        for dtype, count in sorted(type_counts.items()):
+        for dtype, count in sorted(summary.type_counts.items()):
             print(f"  {dtype}: {count}")
 
 
+class TextReporter:
+    """Human-readable report: one block per file, then the summary."""
+
+    def __init__(self, verbose: bool = False, out: TextIO = sys.stdout):
+        self.verbose = verbose
+        self.out = out
+        self.has_output = False
+
+    def report(self, analysis: FileAnalysis) -> None:
+        report = format_violation_report(analysis, self.verbose)
+        if report:
+            print(report, file=self.out)
+            self.has_output = True
+
+    def finish(self, summary: Summary) -> None:
+        if not self.has_output:
+            print("\n✓ No violations found!", file=self.out)
+        print_summary(summary)
+
+
+class JsonLinesReporter:
+    """One JSON record per violation, then a final summary record."""
+
+    def __init__(self, out: TextIO = sys.stdout):
+        self.out = out
+
+    def report(self, analysis: FileAnalysis) -> None:
+        for v in analysis.violations:
+            record = {
+                'type': 'violation',
+                'file': str(v.file_path),
+                'line': v.line_number,
+                'rule': v.rule_id,
+                'severity': v.severity,
+                'category': v.category,
+                'message': v.message,
+                'suggestion': v.suggestion,
+                'declared_type': analysis.declared_type,
+                'inferred_type': analysis.inferred_type,
+            }
+            self.out.write(json.dumps(record) + '\n')
+
+    def finish(self, summary: Summary) -> None:
+        self.out.write(json.dumps({'type': 'summary', **asdict(summary)}) + '\n')
+        self.out.flush()
+
+
+class SarifReporter:
+    """SARIF 2.1.0 log, with results written as they are reported.
+
+    The run's results array is opened up front and the tool description is
+    written after it, so no result has to be held back until the end.
+    """
+
+    LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+    def __init__(self, base_path: Path, out: TextIO = sys.stdout):
+        self.base_path = base_path.resolve()
+        self.out = out
+        # rule id -> category
+        self.rules: Dict[str, str] = {}
+        self.first = True
+        self.out.write(
+            '{"version": "2.1.0", '
+            '"$schema": "https://json.schemastore.org/sarif-2.1.0.json", '
+            '"runs": [{"results": ['
+        )
+
+    def uri(self, file_path: Path) -> str:
+        try:
+            return file_path.resolve().relative_to(self.base_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def report(self, analysis: FileAnalysis) -> None:
+        for v in analysis.violations:
+            location = {'artifactLocation': {'uri': self.uri(v.file_path)}}
+            if v.line_number >= 1:
+                location['region'] = {'startLine': v.line_number}
+
+            result = {
+                'ruleId': v.rule_id,
+                'level': self.LEVELS.get(v.severity, 'none'),
+                'message': {'text': v.message},
+                'locations': [{'physicalLocation': location}],
+            }
+            if v.suggestion:
+                result['properties'] = {'suggestion': v.suggestion}
+
+            self.rules[v.rule_id] = v.category
+            self.out.write(('\n' if self.first else ',\n') + json.dumps(result))
+            self.first = False
+
+    def finish(self, summary: Summary) -> None:
+        tool = {
+            'driver': {
+                'name': 'check-diataxis',
+                'version': CHECKER_VERSION,
+                'informationUri': 'https://diataxis.fr/',
+                'rules': [
+                    {'id': rule_id, 'properties': {'category': category}}
+                    for rule_id, category in sorted(self.rules.items())
+                ],
+            }
+        }
+        self.out.write(
+            f'\n], "tool": {json.dumps(tool)}, '
+            f'"properties": {{"summary": {json.dumps(asdict(summary))}}}}}]}}\n'
+        )
+        self.out.flush()
+
+
+def read_report(report_path: Path, summaries: List[Summary]) -> Iterator[Dict]:
+    """Yield the violation records of a JSON Lines report.
+
+    The report's summary record is appended to ``summaries``; a report
+    without one (e.g. from a shard that died) raises ValueError.
+    """
+    found_summary = False
+    with open(report_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('type') == 'summary':
+                summaries.append(Summary(**{k: v for k, v in record.items() if k != 'type'}))
+                found_summary = True
+            elif record.get('type') == 'violation':
+                yield record
+
+    if not found_summary:
+        raise ValueError(f"{report_path}: no summary record (incomplete report?)")
+
+
+def merge_reports(report_paths: List[Path]) -> Tuple[Iterator[FileAnalysis], Summary]:
+    """Merge JSON Lines shard reports back into one run.
+
+    Returns the per-file analyses, in the same path order as a single-node
+    run, and the combined summary, which is complete once the analyses have
+    been consumed. Each report is read as a stream.
+    """
+    summaries: List[Summary] = []
+    summary = Summary()
+
+    def analyses() -> Iterator[FileAnalysis]:
+        records = heapq.merge(
+            *(read_report(path, summaries) for path in report_paths),
+            key=lambda record: Path(record['file'])
+        )
+        for file_name, file_records in groupby(records, key=lambda record: record['file']):
+            file_path = Path(file_name)
+            analysis = FileAnalysis(file_path=file_path)
+            for record in file_records:
+                analysis.declared_type = record['declared_type']
+                analysis.inferred_type = record['inferred_type']
+                analysis.violations.append(Violation(
+                    file_path=file_path,
+                    line_number=record['line'],
+                    severity=record['severity'],
+                    category=record['category'],
+                    message=record['message'],
+                    suggestion=record['suggestion'],
+                    rule_id=record.get('rule'),
+                ))
+            yield analysis
+
+        for shard_summary in summaries:
+            summary.combine(shard_summary)
+
+    return analyses(), summary
+
+
+def merge_main(argv: List[str]) -> None:
+    """Entry point for the 'merge' sub-command."""
+    parser = argparse.ArgumentParser(
+        prog='check-diataxis.py merge',
+        description='Combine JSON Lines reports from sharded runs into one report'
+    )
+    parser.add_argument(
+        'reports',
+        nargs='+',
+        type=Path,
+        help='Reports written with --format jsonl'
+    )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show suggestions in the text report'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['text', 'jsonl', 'sarif'],
+        default='text',
+        help='Output format for the merged report (default: text)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.format == 'jsonl':
+        reporter = JsonLinesReporter()
+    elif args.format == 'sarif':
+        reporter = SarifReporter(Path.cwd())
+    else:
+        reporter = TextReporter(args.verbose)
+
+    analyses, summary = merge_reports(args.reports)
+    try:
+        for analysis in analyses:
+            reporter.report(analysis)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: could not merge reports: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    reporter.finish(summary)
+
+    # Same exit code as a single-node run
+    sys.exit(1 if summary.files_with_errors else 0)
+
+
+def fit_indicator_weights(
+    rows: List[List[int]],
+    labels: List[str],
+    epochs: int = 200,
+    learning_rate: float = 0.1
+) -> Tuple[List[float], Tuple[int, int], Tuple[int, int]]:
+    """Learn per-indicator weights from documents with a known type.
+
+    ``rows`` are indicator_counts() of each document and ``labels`` their
+    declared types. Starting from the current weights, each epoch scores
+    every document and moves the weights of indicators that fired on a
+    misclassified one: up for its declared type, down (not below zero) for
+    the predicted one. The weights with the fewest misclassified documents,
+    then the fewest type mismatches, are kept, so the result never does
+    worse on these documents than the weights it started from.
+
+    Returns (weights, (misclassified, mismatches) before, and after).
+    """
+    start = heuristic_weights()
+
+    # Identical (counts, label) pairs are scored once, with a multiplicity
+    samples = Counter(zip(map(tuple, rows), labels))
+    sample_rows = [list(row) for row, _ in samples]
+
+    def evaluate(weights: List[float]) -> Tuple[Tuple[int, int], List[Optional[str]]]:
+        model = HeuristicWeights(types=start.types, columns=start.columns, weights=weights)
+        predictions = model.score_rows(sample_rows)
+        errors = mismatches = 0
+        for ((_, label), count), predicted in zip(samples.items(), predictions):
+            if predicted != label:
+                errors += count
+                if predicted is not None:
+                    mismatches += count
+        return (errors, mismatches), predictions
+
+    weights = list(start.weights)
+    initial, predictions = evaluate(weights)
+    best_weights, best = weights, initial
+
+    for _ in range(epochs):
+        if best[0] == 0:
+            break
+
+        delta = [0.0] * len(weights)
+        mistakes = 0
+        for ((row, label), count), predicted in zip(samples.items(), predictions):
+            if predicted == label:
+                continue
+            mistakes += count
+            for index, matches in enumerate(row):
+                if matches:
+                    content_type = start.types[start.columns[index]]
+                    if content_type == label:
+                        delta[index] += count * matches
+                    elif content_type == predicted:
+                        delta[index] -= count * matches
+
+        weights = [max(0.0, weight + learning_rate * change / mistakes) for weight, change in zip(weights, delta)]
+        score, predictions = evaluate(weights)
+        if score < best:
+            best_weights, best = weights, score
+
+    return best_weights, initial, best
+
+
+def fit_main(argv: List[str]) -> None:
+    """Entry point for the 'fit-weights' sub-command."""
+    parser = argparse.ArgumentParser(
+        prog='check-diataxis.py fit-weights',
+        description='Learn per-indicator CONTENT_HEURISTICS weights from docs that declare '
+                    'their diataxis_type, and write them as a rule pack'
+    )
+    parser.add_argument(
+        'path',
+        type=Path,
+        help='Docs directory (or single file) to learn from'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        default=Path('diataxis-weights.json'),
+        help='Rule pack to write (default: diataxis-weights.json)'
+    )
+    parser.add_argument(
+        '--rules',
+        action='append',
+        type=Path,
+        default=[],
+        metavar='PACK',
+        help='Rule pack(s) whose heuristics to fit, as for a normal run'
+    )
+    parser.add_argument(
+        '--epochs',
+        type=int,
+        default=200,
+        metavar='N',
+        help='Maximum training passes over the documents (default: 200)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if not args.path.exists():
+        print(f"Error: Path does not exist: {args.path}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rules:
+        try:
+            use_rules(*load_rule_packs(args.rules))
+        except ValueError as e:
+            print(f"Error: invalid rule pack: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Build the (documents x indicators) count matrix of labelled documents
+    types = heuristic_weights().types
+    rows: List[List[int]] = []
+    labels: List[str] = []
+    files = [args.path] if args.path.is_file() else sorted(args.path.rglob('*.mdx'))
+    for file_path in files:
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Warning: skipping {file_path}: {e}", file=sys.stderr)
+            continue
+        doc = parse_document(file_path, content)
+        if doc.declared_type in types:
+            rows.append(indicator_counts(doc))
+            labels.append(doc.declared_type)
+
+    if not rows:
+        print(f"Error: no .mdx files with a valid diataxis_type under {args.path}", file=sys.stderr)
+        sys.exit(1)
+
+    weights, before, after = fit_indicator_weights(rows, labels, args.epochs)
+
+    pack: Dict[str, Dict] = {'content_heuristics': {}}
+    position = 0
+    for content_type, _, indicators in compile_heuristics():
+        pack['content_heuristics'][content_type] = {
+            'indicators': [pattern.pattern for pattern in indicators],
+            'weight': 1.0,
+            'indicator_weights': [round(weight, 4) for weight in weights[position:position + len(indicators)]],
+        }
+        position += len(indicators)
+
+    try:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(pack, f, indent=2)
+            f.write('\n')
+    except OSError as e:
+        print(f"Error: could not write {args.output}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Fitted on {len(rows)} labelled document(s)")
+    print(f"  Misclassified: {before[0]} -> {after[0]}")
+    print(f"  Type mismatches: {before[1]} -> {after[1]}")
+    print(f"Wrote {args.output}; use it with --rules {args.output}")
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'merge':
+        merge_main(sys.argv[2:])
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'fit-weights':
+        fit_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description='Check Diataxis compliance for Starlight documentation',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -528,13 +2762,108 @@ def main():
     parser.add_argument(
         '--fix',
         action='store_true',
-        help='Attempt to auto-fix violations (experimental)'
+        help='Add a missing title and diataxis_type to frontmatter (descriptions are left to you)'
     )
     parser.add_argument(
         '--severity',
         choices=['error', 'warning', 'info', 'all'],
         default='all',
-        help='Minimum severity level to report'
+        help='Minimum severity level to report; rules below it are not run'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop after the first file with an error'
+    )
+    parser.add_argument(
+        '--max-violations',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Stop once N violations have been reported'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Number of worker processes (default: number of CPU cores)'
+    )
+    parser.add_argument(
+        '--cache-file',
+        type=Path,
+        default=Path('.diataxis-cache.json'),
+        help='Where to keep cached results of unchanged files'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Analyze every file, without reading or writing the cache'
+    )
+    parser.add_argument(
+        '--since',
+        metavar='REF',
+        help='Only check .mdx files added, modified or renamed since this git ref'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and report new/resolved violations as files change'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.5,
+        metavar='SECONDS',
+        help='Polling interval for --watch (default: 0.5)'
+    )
+    parser.add_argument(
+        '--stream-threshold',
+        type=int,
+        default=STREAM_THRESHOLD,
+        metavar='BYTES',
+        help=f'Analyze files larger than this line by line (default: {STREAM_THRESHOLD})'
+    )
+    parser.add_argument(
+        '--read-ahead',
+        type=int,
+        default=READ_AHEAD,
+        metavar='N',
+        help=f'Read up to N files ahead of the one being analyzed; 0 disables (default: {READ_AHEAD})'
+    )
+    parser.add_argument(
+        '--format',
+        choices=['text', 'jsonl', 'sarif'],
+        default='text',
+        help='Output format (default: text); progress goes to stderr for jsonl/sarif'
+    )
+    parser.add_argument(
+        '--shard',
+        type=parse_shard,
+        metavar='I/N',
+        help="Only check the I-th of N deterministic shards of the files (see 'merge')"
+    )
+    parser.add_argument(
+        '--rules',
+        action='append',
+        type=Path,
+        default=[],
+        metavar='PACK',
+        help='Load a TOML (Python 3.11+) or JSON rule pack over the built-in rules; '
+             'can be given more than once'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time rules, check functions and files and report the slowest; '
+             'runs in a single process without the cache'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=10,
+        metavar='N',
+        help='Number of slowest rules and files to show with --profile (default: 10)'
     )
 
     args = parser.parse_args()
@@ -543,40 +2872,153 @@ def main():
         print(f"Error: Path does not exist: {args.path}", file=sys.stderr)
         sys.exit(1)
 
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.max_violations is not None and args.max_violations < 1:
+        print("Error: --max-violations must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    if args.rules:
+        # The validated packs are kept next to the result cache
+        snapshot_path = None
+        if not args.no_cache:
+            snapshot_path = args.cache_file.with_name(args.cache_file.stem + '-rules.json')
+        try:
+            use_rules(*load_rule_packs(args.rules, snapshot_path))
+        except ValueError as e:
+            print(f"Error: invalid rule pack: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    cache = None if args.no_cache else ResultCache(args.cache_file)
+    min_severity = SEVERITY_LEVELS.get(args.severity, 0)
+
+    if args.watch and args.format != 'text':
+        print("Error: --watch only supports --format text", file=sys.stderr)
+        sys.exit(1)
+
+    if args.watch and args.fix:
+        print("Error: --fix cannot be combined with --watch", file=sys.stderr)
+        sys.exit(1)
+
+    if args.watch:
+        watch_directory(args.path, args.verbose, min_severity, args.interval, args.jobs, cache)
+        if cache is not None:
+            cache.save()
+        return
+
+    # Human-readable progress must not end up in machine-readable output
+    if args.format == 'text':
+        log = print
+    else:
+        def log(message: str) -> None:
+            print(message, file=sys.stderr)
+
     # Scan files
-    if args.path.is_file():
-        results = [analyze_file(args.path, args.verbose)]
+    base_path = args.path if args.path.is_dir() else args.path.parent
+    files = None
+    if args.since:
+        try:
+            files = changed_files(args.path, args.since)
+        except (OSError, subprocess.CalledProcessError) as e:
+            detail = (getattr(e, 'stderr', None) or str(e)).strip()
+            print(f"Error: could not list changes since {args.since}: {detail}", file=sys.stderr)
+            sys.exit(1)
+
+        # changed_files returns absolute paths
+        base_path = base_path.resolve()
+        log(f"Checking files changed since {args.since}")
+
+    if args.shard:
+        if files is None:
+            files = [args.path] if args.path.is_file() else sorted(args.path.rglob('*.mdx'))
+        files = shard_files(files, base_path, *args.shard)
+        log(f"Checking shard {args.shard[0]}/{args.shard[1]}")
+
+    profiler = Profiler() if args.profile else None
+
+    if files is not None:
+        results = scan_directory(
+            base_path, args.verbose, args.jobs, cache, files, args.stream_threshold, log, profiler,
+            min_severity, args.read_ahead
+        )
+    elif args.path.is_file():
+        results = analyze_files(
+            [args.path], args.verbose, 1, cache, args.stream_threshold, profiler, min_severity
+        )
     else:
-        results = scan_directory(args.path, args.verbose)
+        results = scan_directory(
+            args.path, args.verbose, args.jobs, cache,
+            stream_threshold=args.stream_threshold, log=log, profiler=profiler,
+            min_severity=min_severity, read_ahead_depth=args.read_ahead
+        )
 
-    # Filter by severity
-    severity_levels = {'error': 3, 'warning': 2, 'info': 1}
-    min_severity = severity_levels.get(args.severity, 0)
+    if args.format == 'jsonl':
+        reporter = JsonLinesReporter()
+    elif args.format == 'sarif':
+        reporter = SarifReporter(base_path)
+    else:
+        reporter = TextReporter(args.verbose)
 
-    # Print violations
-    has_output = False
+    # Report each file as soon as it is done; fixes are written right away,
+    # so only one file's bytes are held at a time
+    summary = Summary(type_checked=infers_type(args.verbose, min_severity))
+    fixed_files = 0
     for analysis in results:
+        if args.fix and any(v.rule_id in FIXABLE_RULES for v in analysis.violations):
+            fix = fix_file(analysis.file_path)
+            if fix is not None:
+                original, fixed = fix
+                if write_fix(analysis.file_path, original, fixed):
+                    fixed_files += 1
+                    analysis = analyze_source(analysis.file_path, fixed, args.verbose, None, min_severity)
+                    if cache is not None:
+                        digest = hashlib.sha256(fixed).hexdigest()
+                        cache.put(analysis.file_path, digest, analysis, args.verbose, min_severity)
+                else:
+                    # Not fixed: report the file as it is on disk now
+                    analysis = analyze_file(
+                        analysis.file_path, args.verbose, args.stream_threshold, None, min_severity
+                    )
+
         if args.severity != 'all':
             # Filter violations by severity
             analysis.violations = [
                 v for v in analysis.violations
-                if severity_levels[v.severity] >= min_severity
+                if v.severity_level >= min_severity
             ]
 
-        report = format_violation_report(analysis, args.verbose)
-        if report:
-            print(report)
-            has_output = True
+        stop_reason = None
+        if args.max_violations is not None:
+            remaining = args.max_violations - summary.total_violations
+            if len(analysis.violations) >= remaining:
+                del analysis.violations[remaining:]
+                stop_reason = f"reached --max-violations {args.max_violations}"
+
+        reporter.report(analysis)
+        summary.add(analysis)
+
+        if args.fail_fast and analysis.has_errors:
+            stop_reason = f"--fail-fast: errors in {analysis.file_path}"
+        if stop_reason:
+            results.close()
+            log(f"Stopped early: {stop_reason}")
+            break
+
+    if args.fix:
+        log(f"Fixed frontmatter in {fixed_files} file(s)")
+
+    if cache is not None:
+        cache.save()
 
-    if not has_output:
-        print("\n✓ No violations found!")
+    reporter.finish(summary)
 
-    # Print summary
-    print_summary(results)
+    if profiler is not None:
+        profiler.report(args.profile_top, sys.stdout if args.format == 'text' else sys.stderr)
 
     # Exit code based on errors
-    has_errors = any(r.has_errors for r in results)
-    sys.exit(1 if has_errors else 0)
+    sys.exit(1 if summary.files_with_errors else 0)
 
 
 if __name__ == '__main__':
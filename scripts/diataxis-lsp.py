@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Diataxis Language Server
+
+A long-lived Language Server Protocol server that reports the checks of
+check-diataxis.py as editor diagnostics while you type, instead of
+re-running the checker on every save.
+
+Each open document keeps per-line facts (forbidden phrase hits, indicator
+counts, required element, step and prerequisite matches, code fences).
+An edit only recomputes the facts of the lines it touched; document-level
+results such as the inferred type, required elements and structure checks
+are rebuilt from running totals and the stored facts.
+
+Usage:
+    ./scripts/diataxis-lsp.py [--rules PACK]
+
+Examples:
+    # Start the server on stdio (editors launch it themselves)
+    ./scripts/diataxis-lsp.py
+
+    # Check with a team rule pack, as with check-diataxis.py --rules
+    ./scripts/diataxis-lsp.py --rules team-rules.toml
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Match, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_script(name: str, filename: str):
+    """Import one of the hyphen-named scripts in this directory as a module."""
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+check_diataxis = load_script('check_diataxis', 'check-diataxis.py')
+
+# LSP DiagnosticSeverity by checker severity
+DIAGNOSTIC_SEVERITIES = {'error': 1, 'warning': 2, 'info': 3}
+
+# LSP TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+
+
+def utf16_length(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit of LSP positions."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-16-le')) // 2
+
+
+def utf16_index(line: str, units: int) -> int:
+    """Index into a line of a position given in UTF-16 code units."""
+    if line.isascii():
+        return min(units, len(line))
+    count = 0
+    for index, char in enumerate(line):
+        if count >= units:
+            return index
+        count += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+class LineFacts:
+    """Everything the checks need to know about one line.
+
+    Forbidden hits and the required flag depend on the declared type, the
+    rest only on the line itself.
+    """
+
+    __slots__ = ('counts', 'hits', 'required', 'fence', 'step', 'prerequisites', 'encoded')
+
+    def __init__(
+        self,
+        counts: Optional[List[int]],
+        hits: List[Tuple[int, Match[str]]],
+        required: bool,
+        fence: bool,
+        step: bool,
+        prerequisites: bool
+    ):
+        self.counts = counts
+        self.hits = hits
+        self.required = required
+        self.fence = fence
+        self.step = step
+        self.prerequisites = prerequisites
+        # Encoded diagnostics of the hits, filled in on first publish
+        self.encoded: Optional[List[Tuple[int, int, str]]] = None
+
+
+class OpenDocument:
+    """An open editor buffer, re-analyzed incrementally on every edit.
+
+    Lines are kept after the same newline translation as analyze_source,
+    so results match check-diataxis.py on the saved file. Indicator counts,
+    required element lines and prerequisite lines are kept as running
+    totals; an edit subtracts the facts of the replaced lines and adds
+    those of the new ones. A change to the declared type recomputes every
+    line, since the forbidden and required rules depend on it.
+    """
+
+    def __init__(self, uri: str, text: str):
+        self.uri = uri
+        self.file_path = Path(unquote(urlparse(uri).path))
+        self.set_text(text)
+
+    def set_text(self, text: str) -> None:
+        self.lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        self.read_frontmatter()
+        self.rebuild()
+
+    def read_frontmatter(self) -> None:
+        """Find the frontmatter block as frontmatter_end() does."""
+        lines = self.lines
+        self.frontmatter_close = None
+        self.frontmatter = None
+        if lines[0] == '---':
+            # The closing line needs a line before it and a newline after it
+            for index in range(2, len(lines) - 1):
+                if lines[index] == '---':
+                    self.frontmatter_close = index
+                    self.frontmatter = check_diataxis.parse_frontmatter_lines(lines[1:index])
+                    break
+
+    @property
+    def declared_type(self) -> Optional[str]:
+        return self.frontmatter.get('diataxis_type') if self.frontmatter else None
+
+    def rebuild(self) -> None:
+        """Recompute every line's facts and the running totals."""
+        self.rules = check_diataxis.compile_rules(self.declared_type) if self.declared_type else None
+        self.indicators = [
+            pattern
+            for _, _, indicators in check_diataxis.compile_heuristics()
+            for pattern in indicators
+        ]
+        self.heuristic_literals = check_diataxis.heuristics_prefilter().matcher
+        self.forbidden_literals = self.rules.forbidden_prefilter.matcher if self.rules is not None else None
+
+        self.counts = [0] * len(self.indicators)
+        self.required_lines = 0
+        self.prerequisite_lines = 0
+        self.facts: List[LineFacts] = []
+        for line in self.lines:
+            facts = self.line_facts(line)
+            self.add(facts, 1)
+            self.facts.append(facts)
+
+    def line_facts(self, line: str) -> LineFacts:
+        """Facts for one line, with the same prefilters as analyze_stream."""
+        line_lower = line.lower()
+        ascii_line = line.isascii()
+        rules = self.rules
+
+        counts = None
+        if not (ascii_line and self.heuristic_literals and not self.heuristic_literals.search(line_lower)):
+            row = [len(pattern.findall(line_lower)) for pattern in self.indicators]
+            if any(row):
+                counts = row
+
+        hits: List[Tuple[int, Match[str]]] = []
+        if (
+            rules is not None and rules.matcher is not None
+            and not (ascii_line and self.forbidden_literals and not self.forbidden_literals.search(line_lower))
+        ):
+            hits = list(check_diataxis.match_forbidden(rules, line))
+
+        return LineFacts(
+            counts=counts,
+            hits=hits,
+            required=rules is not None and rules.required is not None and rules.required.search(line) is not None,
+            fence='```' in line,
+            step=check_diataxis.STEP_PATTERN.search(line) is not None,
+            prerequisites=check_diataxis.PREREQUISITES_PATTERN.search(line) is not None,
+        )
+
+    def add(self, facts: LineFacts, sign: int) -> None:
+        """Add (sign 1) or remove (sign -1) a line's facts from the totals."""
+        if facts.counts is not None:
+            self.counts = [total + sign * count for total, count in zip(self.counts, facts.counts)]
+        self.required_lines += sign * facts.required
+        self.prerequisite_lines += sign * facts.prerequisites
+
+    def apply_change(self, change: Dict[str, Any]) -> None:
+        """Apply one TextDocumentContentChangeEvent."""
+        if 'range' not in change:
+            self.set_text(change['text'])
+            return
+
+        start, end = change['range']['start'], change['range']['end']
+        start_line = min(start['line'], len(self.lines) - 1)
+        end_line = min(end['line'], len(self.lines) - 1)
+        head = self.lines[start_line]
+        tail = self.lines[end_line]
+        text = change['text'].replace('\r\n', '\n').replace('\r', '\n')
+        new_lines = (
+            head[:utf16_index(head, start['character'])] + text + tail[utf16_index(tail, end['character']):]
+        ).split('\n')
+
+        self.lines[start_line:end_line + 1] = new_lines
+
+        # Only edits at or above the closing '---' can change the frontmatter
+        if self.frontmatter_close is None or start_line <= self.frontmatter_close:
+            declared_type = self.declared_type
+            self.read_frontmatter()
+            if self.declared_type != declared_type:
+                self.rebuild()
+                return
+
+        for facts in self.facts[start_line:end_line + 1]:
+            self.add(facts, -1)
+        new_facts = [self.line_facts(line) for line in new_lines]
+        for facts in new_facts:
+            self.add(facts, 1)
+        self.facts[start_line:end_line + 1] = new_facts
+
+    def hit_diagnostics(self, line_index: int) -> List[Tuple[int, int, str]]:
+        """(start, end, encoded fields) of a line's forbidden phrase diagnostics.
+
+        Hits only depend on the line, so they are encoded once and reused
+        until the line changes, wherever it moves.
+        """
+        facts = self.facts[line_index]
+        if facts.encoded is None:
+            line = self.lines[line_index]
+            declared_type = self.declared_type
+            facts.encoded = []
+            for index, match in facts.hits:
+                reason = self.rules.forbidden[index][1]
+                violation = check_diataxis.forbidden_violation(
+                    self.file_path, line_index + 1, declared_type, index, reason, match
+                )
+                start = utf16_length(line[:match.start()])
+                facts.encoded.append((start, start + utf16_length(match.group()), encode_fields(violation)))
+        return facts.encoded
+
+    def document_violations(self) -> List['check_diataxis.Violation']:
+        """Every violation except forbidden phrase hits, as analyze_source finds them."""
+        file_path = self.file_path
+        declared_type = self.declared_type
+        analysis = check_diataxis.FileAnalysis(file_path=file_path, declared_type=declared_type)
+        analysis.inferred_type = check_diataxis.heuristic_weights().score(self.counts)
+        analysis.violations.extend(check_diataxis.frontmatter_violations(file_path, self.frontmatter))
+
+        rules = self.rules
+        if rules is not None and rules.required is not None and not self.required_lines:
+            analysis.violations.append(check_diataxis.missing_required_violation(file_path, rules))
+
+        code_blocks = check_diataxis.CodeBlockCounter()
+        steps_line = 1
+        has_steps = False
+        if declared_type == 'explanation':
+            for line_num, facts in enumerate(self.facts, 1):
+                if facts.fence:
+                    code_blocks.feed(self.lines[line_num - 1], line_num)
+        elif declared_type == 'reference':
+            steps_line = next((n for n, facts in enumerate(self.facts, 1) if facts.step), 0)
+            has_steps = steps_line > 0
+        code_blocks_line = 1
+        if code_blocks.count > check_diataxis.MAX_EXPLANATION_CODE_BLOCKS:
+            code_blocks_line = code_blocks.lines[check_diataxis.MAX_EXPLANATION_CODE_BLOCKS]
+        analysis.violations.extend(check_diataxis.structure_violations(
+            file_path, declared_type, code_blocks.count, has_steps, self.prerequisite_lines > 0,
+            code_blocks_line, steps_line
+        ))
+
+        return check_diataxis.finish_analysis(analysis).violations
+
+    def diagnostics(self) -> List[str]:
+        """JSON-encoded LSP diagnostics for the current text."""
+        diagnostics = []
+        for violation in self.document_violations():
+            line_index = min(max(violation.line_number - 1, 0), len(self.lines) - 1)
+            diagnostics.append(encode_diagnostic(
+                line_index, 0, utf16_length(self.lines[line_index]), encode_fields(violation)
+            ))
+
+        for line_index, facts in enumerate(self.facts):
+            if facts.hits:
+                for start, end, fields in self.hit_diagnostics(line_index):
+                    diagnostics.append(encode_diagnostic(line_index, start, end, fields))
+        return diagnostics
+
+
+def encode_fields(violation: 'check_diataxis.Violation') -> str:
+    """JSON members of a diagnostic other than its range."""
+    message = violation.message
+    if violation.suggestion:
+        message += f"\n{violation.suggestion}"
+    return json.dumps({
+        'severity': DIAGNOSTIC_SEVERITIES[violation.severity],
+        'code': violation.rule_id,
+        'source': 'diataxis',
+        'message': message,
+    })[1:-1]
+
+
+def encode_diagnostic(line_index: int, start: int, end: int, fields: str) -> str:
+    """JSON of one diagnostic on a single line."""
+    return (
+        f'{{"range":{{"start":{{"line":{line_index},"character":{start}}},'
+        f'"end":{{"line":{line_index},"character":{end}}}}},{fields}}}'
+    )
+
+
+class LanguageServer:
+    """JSON-RPC over stdio, with just the LSP methods diagnostics need."""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.reader = reader
+        self.writer = writer
+        self.documents: Dict[str, OpenDocument] = {}
+        self.shutdown_requested = False
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'initialize': self.initialize,
+            'shutdown': self.shutdown,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+        }
+
+    def read_message(self) -> Optional[Dict[str, Any]]:
+        """Read one framed message, or None at end of input."""
+        length = None
+        while True:
+            header = self.reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        if length is None:
+            return None
+        return json.loads(self.reader.read(length).decode('utf-8'))
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self.write(json.dumps({'jsonrpc': '2.0', **message}, separators=(',', ':')))
+
+    def write(self, body: str) -> None:
+        data = body.encode('utf-8')
+        self.writer.write(f"Content-Length: {len(data)}\r\n\r\n".encode('ascii') + data)
+        self.writer.flush()
+
+    def publish(self, uri: str, diagnostics: List[str]) -> None:
+        # Diagnostics arrive already encoded, so they are joined, not re-encoded
+        self.write(
+            '{"jsonrpc":"2.0","method":"textDocument/publishDiagnostics",'
+            f'"params":{{"uri":{json.dumps(uri)},"diagnostics":[{",".join(diagnostics)}]}}}}'
+        )
+
+    def initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+            },
+            'serverInfo': {'name': 'diataxis-lsp', 'version': check_diataxis.CHECKER_VERSION},
+        }
+
+    def shutdown(self, params: Any) -> None:
+        self.shutdown_requested = True
+
+    def did_open(self, params: Dict[str, Any]) -> None:
+        item = params['textDocument']
+        document = self.documents[item['uri']] = OpenDocument(item['uri'], item['text'])
+        self.publish(document.uri, document.diagnostics())
+
+    def did_change(self, params: Dict[str, Any]) -> None:
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return
+        for change in params['contentChanges']:
+            document.apply_change(change)
+        self.publish(document.uri, document.diagnostics())
+
+    def did_close(self, params: Dict[str, Any]) -> None:
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self.publish(uri, [])
+
+    def serve(self) -> int:
+        """Handle messages until 'exit'; returns the process exit code."""
+        while True:
+            message = self.read_message()
+            if message is None:
+                return 1
+            method = message.get('method')
+            if method == 'exit':
+                return 0 if self.shutdown_requested else 1
+
+            handler = self.handlers.get(method)
+            is_request = 'id' in message
+            if handler is None:
+                if is_request:
+                    self.send({'id': message['id'], 'error': {'code': -32601, 'message': f"Unknown method: {method}"}})
+                continue
+
+            try:
+                result = handler(message.get('params'))
+            except Exception as e:
+                print(f"Error: {method} failed: {e}", file=sys.stderr)
+                if is_request:
+                    self.send({'id': message['id'], 'error': {'code': -32603, 'message': str(e)}})
+                continue
+            if is_request:
+                self.send({'id': message['id'], 'result': result})
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Language server reporting Diataxis compliance as editor diagnostics'
+    )
+    parser.add_argument(
+        '--rules',
+        action='append',
+        type=Path,
+        default=[],
+        metavar='PACK',
+        help='Load rules from a TOML or JSON rule pack (repeatable; applied in order)'
+    )
+
+    args = parser.parse_args()
+
+    if args.rules:
+        try:
+            check_diataxis.use_rules(*check_diataxis.load_rule_packs(args.rules))
+        except ValueError as e:
+            print(f"Error: invalid rule pack: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    sys.exit(server.serve())
+
+
+if __name__ == '__main__':
+    main()
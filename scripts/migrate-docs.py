@@ -17,26 +17,66 @@ Examples:
 
     # Migrate only metrics section
     ./scripts/migrate-docs.py --section metrics
+
+    # Limit the number of worker processes
+    ./scripts/migrate-docs.py --jobs 4
+
+    # List the headings of the source, to address sections by heading path
+    ./scripts/migrate-docs.py --list-headings
+
+    # Fail if any generated page is out of date, without writing (for CI)
+    ./scripts/migrate-docs.py --check
 """
 
 import argparse
+import contextlib
+import hashlib
+import json
 import os
 import re
 import sys
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 @dataclass
 class Section:
-    """Represents a documentation section to be migrated."""
+    """Represents a documentation section to be migrated.
+
+    With a ``heading`` the section is located through the heading index of
+    the source and follows its content when the source changes. If the
+    heading is not found the section fails rather than falling back to the
+    line range, which no longer matches the source by then.
+    """
     title: str
     start_line: int
     end_line: int
     diataxis_type: str  # tutorial, how-to, reference, explanation
     target_path: str
     description: str
+    # Heading path ("Parent > Child") or a heading title unique in the source
+    heading: Optional[str] = None
+
+
+# ATX headings; a trailing {#anchor} is not part of the title
+HEADING_PATTERN = re.compile(r'^(#{1,6})[ \t]+(.*?)(?:[ \t]+\{#[^}]*\})?(?:[ \t]+#+)?[ \t]*$')
+FENCES = ('```', '~~~')
+
+# Characters of section content sent to a worker per task (see migrate_sections);
+# smaller sources are split into about one batch per worker, but no smaller
+# than MIN_BATCH_CHARS, below which a round trip costs more than it saves
+BATCH_CHARS = 256 * 1024
+MIN_BATCH_CHARS = 16 * 1024
+HEADING_PATH_SEPARATOR = ' > '
+
+# Bump whenever convert_section() would produce different output, so the
+# manifest regenerates every section
+TRANSFORM_VERSION = '1'
+MANIFEST_NAME = '.migrate-docs-manifest.json'
 
 
 # Diataxis language patterns for content transformation
@@ -76,7 +116,8 @@ SECTIONS = [
         end_line=230,
         diataxis_type="reference",
         target_path="src/content/docs/reference/metrics.mdx",
-        description="Complete reference for Prometheus metrics exposed by Radicale"
+        description="Complete reference for Prometheus metrics exposed by Radicale",
+        heading="Prometheus Metrics"
     ),
     Section(
         title="Metrics Quick Start",
@@ -84,7 +125,8 @@ SECTIONS = [
         end_line=56,
         diataxis_type="tutorial",
         target_path="src/content/docs/tutorials/metrics.mdx",
-        description="Learn to set up Prometheus metrics monitoring in 5 minutes"
+        description="Learn to set up Prometheus metrics monitoring in 5 minutes",
+        heading="Metrics Quick Start"
     ),
     Section(
         title="Prometheus Integration",
@@ -92,7 +134,8 @@ SECTIONS = [
         end_line=230,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/monitoring/prometheus.mdx",
-        description="Configure Prometheus to scrape Radicale metrics"
+        description="Configure Prometheus to scrape Radicale metrics",
+        heading="Prometheus Integration"
     ),
     Section(
         title="Enhanced VTODO Support",
@@ -100,7 +143,8 @@ SECTIONS = [
         end_line=417,
         diataxis_type="reference",
         target_path="src/content/docs/reference/vtodo-rfc9253.mdx",
-        description="RFC 9253 Task Extensions API reference"
+        description="RFC 9253 Task Extensions API reference",
+        heading="Enhanced VTODO Support"
     ),
     Section(
         title="CardDAV Directory Gateway",
@@ -108,7 +152,8 @@ SECTIONS = [
         end_line=606,
         diataxis_type="reference",
         target_path="src/content/docs/reference/directory-gateway.mdx",
-        description="LDAP/Active Directory integration reference"
+        description="LDAP/Active Directory integration reference",
+        heading="CardDAV Directory Gateway"
     ),
     Section(
         title="LDAP Configuration",
@@ -116,7 +161,8 @@ SECTIONS = [
         end_line=468,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/directory/ldap.mdx",
-        description="Configure LDAP directory gateway for contact lookup"
+        description="Configure LDAP directory gateway for contact lookup",
+        heading="LDAP Configuration"
     ),
     Section(
         title="Active Directory Integration",
@@ -124,7 +170,8 @@ SECTIONS = [
         end_line=551,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/directory/active-directory.mdx",
-        description="Integrate Radicale with Microsoft Active Directory"
+        description="Integrate Radicale with Microsoft Active Directory",
+        heading="Active Directory Integration"
     ),
     Section(
         title="WebSocket Real-time Sync",
@@ -132,7 +179,8 @@ SECTIONS = [
         end_line=962,
         diataxis_type="reference",
         target_path="src/content/docs/reference/websocket-protocol.mdx",
-        description="WebSocket real-time sync protocol specification"
+        description="WebSocket real-time sync protocol specification",
+        heading="WebSocket Real-time Sync"
     ),
     Section(
         title="WebSocket Client Integration",
@@ -140,7 +188,8 @@ SECTIONS = [
         end_line=944,
         diataxis_type="tutorial",
         target_path="src/content/docs/tutorials/websocket.mdx",
-        description="Build a WebSocket sync client for real-time updates"
+        description="Build a WebSocket sync client for real-time updates",
+        heading="WebSocket Client Integration"
     ),
     Section(
         title="RFC 3253 Versioning",
@@ -148,7 +197,8 @@ SECTIONS = [
         end_line=1788,
         diataxis_type="reference",
         target_path="src/content/docs/reference/versioning-deltav.mdx",
-        description="RFC 3253 DeltaV versioning protocol reference"
+        description="RFC 3253 DeltaV versioning protocol reference",
+        heading="RFC 3253 Versioning"
     ),
     Section(
         title="Versioning Configuration",
@@ -156,7 +206,8 @@ SECTIONS = [
         end_line=1023,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/versioning/enable.mdx",
-        description="Enable and configure git-backed versioning"
+        description="Enable and configure git-backed versioning",
+        heading="Versioning Configuration"
     ),
     Section(
         title="Version Labels",
@@ -164,7 +215,8 @@ SECTIONS = [
         end_line=1528,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/versioning/labels.mdx",
-        description="Use version labels for release management"
+        description="Use version labels for release management",
+        heading="Version Labels"
     ),
     Section(
         title="Activities (Change Sets)",
@@ -172,7 +224,8 @@ SECTIONS = [
         end_line=1788,
         diataxis_type="how-to",
         target_path="src/content/docs/how-to/versioning/activities.mdx",
-        description="Group related changes into activities"
+        description="Group related changes into activities",
+        heading="Activities (Change Sets)"
     ),
     Section(
         title="Versioning Concepts",
@@ -180,16 +233,88 @@ SECTIONS = [
         end_line=977,
         diataxis_type="explanation",
         target_path="src/content/docs/explanations/versioning.mdx",
-        description="Understanding DeltaV versioning and when to use it"
+        description="Understanding DeltaV versioning and when to use it",
+        heading="Versioning Concepts"
     ),
 ]
 
 
-def read_source_file(source_path: Path) -> List[str]:
-    """Read the source markdown file and return lines."""
+@dataclass
+class HeadingIndex:
+    """(start_line, end_line) span of each heading's section in the source.
+
+    Lines are 1-indexed and inclusive, like Section line ranges.
+    """
+    # Full heading path ("Parent > Child") -> span
+    paths: Dict[str, Tuple[int, int]]
+    # Heading title -> span, for titles that only one heading has
+    titles: Dict[str, Tuple[int, int]]
+    line_count: int = 0
+
+    def get(self, heading: str) -> Optional[Tuple[int, int]]:
+        """Span of a heading path, or of a unique heading title."""
+        span = self.paths.get(heading)
+        return span if span is not None else self.titles.get(heading)
+
+
+def build_heading_index(lines: Iterable[str]) -> HeadingIndex:
+    """Index the heading sections of the source in one pass.
+
+    A section runs from its heading to the line before the next heading of
+    the same or a higher level, without trailing blank lines. Headings
+    inside fenced code blocks are ignored. ``lines`` may be an open file;
+    no text is kept.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    titles: Dict[str, Optional[Tuple[int, int]]] = {}
+    # (level, title, path, start_line) of headings whose section is still open
+    open_headings: List[Tuple[int, str, str, int]] = []
+    last_content_line = 0
+    line_number = 0
+    fence = None
+
+    def close(level: int) -> None:
+        while open_headings and open_headings[-1][0] >= level:
+            _, title, path, start_line = open_headings.pop()
+            span = (start_line, max(start_line, last_content_line))
+            index[path] = span
+            # A title shared by several headings is ambiguous on its own
+            titles[title] = None if title in titles else span
+
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+
+        if stripped.startswith(FENCES):
+            if fence is None:
+                fence = stripped[:3]
+            elif stripped.startswith(fence):
+                fence = None
+        elif fence is None and line.startswith('#'):
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                level = len(heading.group(1))
+                close(level)
+                title = heading.group(2)
+                parent = open_headings[-1][2] + HEADING_PATH_SEPARATOR if open_headings else ''
+                open_headings.append((level, title, parent + title, line_number))
+        last_content_line = line_number
+
+    close(1)
+
+    return HeadingIndex(
+        paths=index,
+        titles={title: span for title, span in titles.items() if span is not None},
+        line_count=line_number
+    )
+
+
+def index_source_file(source_path: Path) -> HeadingIndex:
+    """Stream the source markdown file once to index its headings."""
     try:
         with open(source_path, 'r', encoding='utf-8') as f:
-            return f.readlines()
+            return build_heading_index(f)
     except FileNotFoundError:
         print(f"Error: Source file not found: {source_path}", file=sys.stderr)
         sys.exit(1)
@@ -198,19 +323,99 @@ def read_source_file(source_path: Path) -> List[str]:
         sys.exit(1)
 
 
-def extract_section(lines: List[str], section: Section) -> str:
-    """Extract content for a section based on line numbers."""
+def section_lines(section: Section, heading_index: Optional[HeadingIndex] = None) -> Tuple[int, int]:
+    """The (start_line, end_line) of a section: by heading, else by its line range.
+
+    Raises ValueError if the section has a heading the source does not have.
+    """
+    if section.heading and heading_index is not None:
+        span = heading_index.get(section.heading)
+        if span is None:
+            raise ValueError(
+                f"Heading '{section.heading}' not found in the source "
+                f"(see --list-headings)"
+            )
+        return span
+    return section.start_line, section.end_line
+
+
+def extract_section(
+    lines: List[str],
+    section: Section,
+    heading_index: Optional[HeadingIndex] = None
+) -> str:
+    """Extract content for a section, located by heading or by line numbers."""
+    start_line, end_line = section_lines(section, heading_index)
+
     # Line numbers are 1-indexed in the file, 0-indexed in list
-    start_idx = section.start_line - 1
-    end_idx = section.end_line
+    start_idx = start_line - 1
+    end_idx = end_line
 
     if start_idx < 0 or end_idx > len(lines):
-        raise ValueError(f"Invalid line range for section '{section.title}': {section.start_line}-{section.end_line}")
+        raise ValueError(f"Invalid line range for section '{section.title}': {start_line}-{end_line}")
 
     content_lines = lines[start_idx:end_idx]
     return ''.join(content_lines)
 
 
+def extract_sections(
+    source_path: Path,
+    sections: List[Section],
+    heading_index: HeadingIndex,
+    failed: Optional[List[Section]] = None
+) -> Iterator[Tuple[Section, str]]:
+    """Extract every section in a single streaming pass over the source.
+
+    Each (section, content) is yielded as soon as the section's last line
+    has been read, so sections come out in order of where they end. Open
+    sections collect references to the lines read so far. Overlapping
+    sections share the same line strings, so memory follows the sections
+    that are open, not the file size times the overlap.
+
+    Sections that cannot be located in the source are reported and
+    appended to ``failed``.
+    """
+    # Sections to open and to emit once this many lines have been read
+    opening: Dict[int, List[int]] = defaultdict(list)
+    closing: Dict[int, List[int]] = defaultdict(list)
+    for order, section in enumerate(sections):
+        try:
+            start_line, end_line = section_lines(section, heading_index)
+            if start_line < 1 or end_line > heading_index.line_count:
+                raise ValueError(f"Invalid line range for section '{section.title}': {start_line}-{end_line}")
+        except ValueError as e:
+            print(f"✗ Error processing section '{section.title}': {e}", file=sys.stderr)
+            if failed is not None:
+                failed.append(section)
+            continue
+        if end_line < start_line:
+            yield section, ''
+        else:
+            opening[start_line - 1].append(order)
+            closing[end_line].append(order)
+
+    # Between two boundaries the set of open sections does not change, so
+    # lines are read in chunks and appended to every open section at once
+    buffers: Dict[int, List[str]] = {}
+    position = 0
+    with open(source_path, 'r', encoding='utf-8') as f:
+        for boundary in sorted(opening.keys() | closing.keys()):
+            chunk = islice(f, boundary - position)
+            if buffers:
+                chunk = list(chunk)
+                for buffer in buffers.values():
+                    buffer.extend(chunk)
+            else:
+                for _ in chunk:
+                    pass
+            position = boundary
+
+            for order in closing.get(boundary, ()):
+                yield sections[order], ''.join(buffers.pop(order))
+            for order in opening.get(boundary, ()):
+                buffers[order] = []
+
+
 def apply_diataxis_patterns(content: str, diataxis_type: str) -> str:
     """Apply Diataxis language patterns to content."""
     patterns = DIATAXIS_PATTERNS.get(diataxis_type, {})
@@ -289,54 +494,376 @@ def add_diataxis_intro(section: Section, content: str) -> str:
     return content
 
 
-def write_output_file(target_path: Path, content: str, dry_run: bool = False) -> None:
-    """Write content to target file, creating directories as needed."""
+def write_output_file(target_path: Path, content: str, dry_run: bool = False) -> Optional[bool]:
+    """Write content to target file, creating directories as needed.
+
+    The file is only written when its bytes change, through a temporary
+    sibling that replaces it, so unchanged targets keep their mtime and a
+    half-written file is never visible. Returns True if it was written,
+    False if it already held this content, and None on a dry run or error.
+    """
     if dry_run:
         print(f"[DRY RUN] Would write to: {target_path}")
         print(f"[DRY RUN] Content preview (first 200 chars):\n{content[:200]}...\n")
-        return
+        return None
 
+    data = content.encode('utf-8')
+    tmp_path = target_path.with_name(f".{target_path.name}.tmp")
     try:
+        try:
+            existing = target_path.read_bytes()
+        except FileNotFoundError:
+            existing = None
+        if existing == data:
+            print(f"= Unchanged: {target_path}")
+            return False
+
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(target_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✓ Created: {target_path}")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, target_path)
+        print(f"✓ {'Created' if existing is None else 'Updated'}: {target_path}")
+        return True
     except Exception as e:
         print(f"✗ Error writing {target_path}: {e}", file=sys.stderr)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        return None
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def section_digest(section: Section) -> str:
+    """Hash of the Section fields that shape its output besides the source."""
+    return sha256_text(json.dumps([section.title, section.description, section.diataxis_type]))
+
+
+class MigrationManifest:
+    """What each target was generated from, kept between runs.
+
+    Entries are keyed by target path and record the hash of the extracted
+    source span, the transform version, a hash of the section definition
+    and the hash of the target as written or accepted. A section whose
+    inputs are all unchanged and whose target still has the recorded hash
+    is up to date. A target that no longer has it was edited by hand; an
+    entry marked ``edited`` records a hand edit that was accepted with
+    --accept. Hand-edited targets are not regenerated without --force.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # Source hash of each section looked at in this run, by target path
+        self.sources: Dict[str, str] = {}
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(stored, dict) and isinstance(stored.get('entries'), dict):
+            self.entries = stored['entries']
+
+    def status(self, section: Section, content: str, base_path: Path) -> Tuple[List[str], bool]:
+        """Why a section's target is out of date, and whether it has hand edits.
+
+        The reasons are empty if the target is current. An unaccepted hand
+        edit is reported along with any change to the section's inputs, so
+        an upstream change is not hidden by a local one.
+        """
+        source_sha256 = self.sources[section.target_path] = sha256_text(content)
+        entry = self.entries.get(section.target_path)
+
+        try:
+            output_sha256 = hashlib.sha256((base_path / section.target_path).read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return ['target missing'], False
+        if not isinstance(entry, dict):
+            return ['not in manifest'], False
+
+        reasons = []
+        if output_sha256 != entry.get('output_sha256'):
+            reasons.append('edited by hand')
+        if entry.get('source_sha256') != source_sha256:
+            reasons.append('source changed')
+        if (entry.get('transform_version') != TRANSFORM_VERSION
+                or entry.get('section_sha256') != section_digest(section)):
+            reasons.append('transform changed')
+        return reasons, 'edited by hand' in reasons or bool(entry.get('edited'))
+
+    def record(self, section: Section, full_content: str, edited: bool = False) -> None:
+        """Remember that a section's target now holds full_content.
+
+        ``edited`` marks content that differs from the generated output.
+        """
+        entry = {
+            'source_sha256': self.sources[section.target_path],
+            'transform_version': TRANSFORM_VERSION,
+            'section_sha256': section_digest(section),
+            'output_sha256': sha256_text(full_content),
+        }
+        if edited:
+            entry['edited'] = True
+        self.entries[section.target_path] = entry
+
+    def save(self, sections: List[Section]) -> None:
+        """Write the manifest, dropping entries for targets not in sections."""
+        targets = {section.target_path for section in sections}
+        entries = {target: entry for target, entry in self.entries.items() if target in targets}
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f, indent=2, sort_keys=True)
+                f.write('\n')
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not write manifest {self.path}: {e}", file=sys.stderr)
+
+
+def outdated_sections(
+    extracted: Iterable[Tuple[Section, str]],
+    manifest: MigrationManifest,
+    base_path: Path,
+    force: bool = False,
+    skipped: Optional[List[Section]] = None
+) -> Iterator[Tuple[Section, str]]:
+    """Pass on only the sections whose target is out of date.
+
+    Up-to-date sections, and out-of-date targets with hand edits unless
+    ``force``, are appended to ``skipped``.
+    """
+    for section, content in extracted:
+        reasons, edited = manifest.status(section, content, base_path)
+        if reasons and edited and not force:
+            print(
+                f"Warning: {base_path / section.target_path} has hand edits ({', '.join(reasons)}); "
+                f"not overwriting it (merge by hand and use --accept, or --force to regenerate)",
+                file=sys.stderr
+            )
+            reasons = []
+        if not reasons:
+            if skipped is not None:
+                skipped.append(section)
+            continue
+        yield section, content
+
+
+def check_sections(
+    extracted: Iterable[Tuple[Section, str]],
+    manifest: MigrationManifest,
+    base_path: Path
+) -> int:
+    """Report every out-of-date target without writing; returns how many.
+
+    A hand edit with no other change is only a warning: the target is as
+    intended until its inputs change.
+    """
+    stale = 0
+    for section, content in extracted:
+        reasons, _ = manifest.status(section, content, base_path)
+        if reasons == ['edited by hand']:
+            print(f"! Edited by hand: {section.target_path} (use --accept to record it)")
+        elif reasons:
+            print(f"✗ Stale: {section.target_path} ({', '.join(reasons)})")
+            stale += 1
+    return stale
+
+
+def accept_sections(
+    extracted: Iterable[Tuple[Section, str]],
+    manifest: MigrationManifest,
+    base_path: Path
+) -> int:
+    """Record the targets as they are on disk as current; returns how many.
+
+    Targets that differ from the generated output are marked as edited, so
+    later runs keep them until the source changes and --force is given.
+    """
+    accepted = 0
+    for section, content in extracted:
+        manifest.sources[section.target_path] = sha256_text(content)
+        target_path = base_path / section.target_path
+        try:
+            current = target_path.read_bytes().decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"✗ Not accepting {target_path}: {e}", file=sys.stderr)
+            continue
+        try:
+            edited = current != convert_section(section, content)
+        except Exception as e:
+            print(f"✗ Error processing section '{section.title}': {e}", file=sys.stderr)
+            continue
+        manifest.record(section, current, edited)
+        print(f"✓ Accepted{' (edited by hand)' if edited else ''}: {target_path}")
+        accepted += 1
+    return accepted
 
 
 def migrate_section(
     source_lines: List[str],
     section: Section,
     base_path: Path,
-    dry_run: bool = False
+    dry_run: bool = False,
+    heading_index: Optional[HeadingIndex] = None
 ) -> None:
     """Migrate a single section to its target location."""
+    try:
+        content = extract_section(source_lines, section, heading_index)
+    except ValueError as e:
+        print(f"✗ Error processing section '{section.title}': {e}", file=sys.stderr)
+        return
+
+    migrate_content(section, content, base_path, dry_run)
+
+
+def write_section(
+    section: Section,
+    full_content: str,
+    base_path: Path,
+    dry_run: bool = False,
+    manifest: Optional[MigrationManifest] = None
+) -> bool:
+    """Write a converted section and record it in the manifest.
+
+    Returns whether the target was written.
+    """
+    result = write_output_file(base_path / section.target_path, full_content, dry_run)
+    if result is not None and manifest is not None:
+        manifest.record(section, full_content)
+    return bool(result)
+
+
+def convert_section(section: Section, content: str) -> str:
+    """Turn a section's extracted markdown into the complete .mdx file."""
+    # Apply transformations
+    content = apply_diataxis_patterns(content, section.diataxis_type)
+    content = clean_markdown_for_mdx(content)
+    content = add_diataxis_intro(section, content)
+
+    # Generate frontmatter
+    frontmatter = generate_frontmatter(section)
+
+    # Combine frontmatter and content
+    return frontmatter + content
+
+
+def print_section_header(section: Section) -> None:
     print(f"\nProcessing: {section.title} ({section.diataxis_type})")
-    print(f"  Lines: {section.start_line}-{section.end_line}")
+    if section.heading:
+        print(f"  Heading: {section.heading}")
+    else:
+        print(f"  Lines: {section.start_line}-{section.end_line}")
     print(f"  Target: {section.target_path}")
 
+
+def migrate_content(
+    section: Section,
+    content: str,
+    base_path: Path,
+    dry_run: bool = False,
+    manifest: Optional[MigrationManifest] = None
+) -> bool:
+    """Convert a section's extracted content and write it to its target.
+
+    Returns whether the target was written.
+    """
+    print_section_header(section)
     try:
-        # Extract content
-        content = extract_section(source_lines, section)
+        full_content = convert_section(section, content)
+    except Exception as e:
+        print(f"✗ Error processing section '{section.title}': {e}", file=sys.stderr)
+        return False
 
-        # Apply transformations
-        content = apply_diataxis_patterns(content, section.diataxis_type)
-        content = clean_markdown_for_mdx(content)
-        content = add_diataxis_intro(section, content)
+    # Write to target
+    return write_section(section, full_content, base_path, dry_run, manifest)
 
-        # Generate frontmatter
-        frontmatter = generate_frontmatter(section)
 
-        # Combine frontmatter and content
-        full_content = frontmatter + content
+def convert_batch(batch: List[Tuple[Section, str]]) -> List[Union[str, Exception]]:
+    """Convert several sections in a worker, returning each result or error."""
+    results: List[Union[str, Exception]] = []
+    for section, content in batch:
+        try:
+            results.append(convert_section(section, content))
+        except Exception as e:
+            results.append(e)
+    return results
 
-        # Write to target
-        target_path = base_path / section.target_path
-        write_output_file(target_path, full_content, dry_run)
 
-    except Exception as e:
-        print(f"✗ Error processing section '{section.title}': {e}", file=sys.stderr)
+def migrate_sections(
+    extracted: Iterable[Tuple[Section, str]],
+    base_path: Path,
+    dry_run: bool = False,
+    jobs: Optional[int] = None,
+    manifest: Optional[MigrationManifest] = None,
+    batch_chars: int = BATCH_CHARS
+) -> int:
+    """Convert sections across ``jobs`` worker processes and write them here.
+
+    Sections are sent to the workers in batches of up to about
+    ``batch_chars`` characters, so many small sections don't each pay for
+    a round trip. Only a few batches per worker are in flight at once, and
+    sections are reported and written in the order they arrive. If all
+    sections fit in one batch no workers are started, as only one of them
+    would have work. Returns the number of files written.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    extracted = iter(extracted)
+
+    first_batch: List[Tuple[Section, str]] = []
+    first_chars = 0
+    if jobs > 1:
+        for section, content in extracted:
+            first_batch.append((section, content))
+            first_chars += len(content)
+            if first_chars >= batch_chars:
+                break
+
+    if jobs <= 1 or first_chars < batch_chars:
+        return sum(
+            migrate_content(section, content, base_path, dry_run, manifest)
+            for section, content in chain(first_batch, extracted)
+        )
+
+    written = 0
+    pending: Deque[Tuple[List[Section], 'Future[List[Union[str, Exception]]]']] = deque()
+
+    def finish() -> int:
+        sections, converted = pending.popleft()
+        count = 0
+        for section, full_content in zip(sections, converted.result()):
+            print_section_header(section)
+            if isinstance(full_content, Exception):
+                print(f"✗ Error processing section '{section.title}': {full_content}", file=sys.stderr)
+            else:
+                count += write_section(section, full_content, base_path, dry_run, manifest)
+        return count
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        batch: List[Tuple[Section, str]] = []
+        chars = 0
+
+        def submit() -> None:
+            pending.append(([section for section, _ in batch], executor.submit(convert_batch, list(batch))))
+            batch.clear()
+
+        for section, content in chain(first_batch, extracted):
+            batch.append((section, content))
+            chars += len(content)
+            if chars >= batch_chars:
+                submit()
+                chars = 0
+                while len(pending) > jobs * 4:
+                    written += finish()
+        if batch:
+            submit()
+        while pending:
+            written += finish()
+
+    return written
 
 
 def main():
@@ -367,13 +894,59 @@ def main():
         default=Path('/home/rpm/claude/radicale/radicale-docs'),
         help='Base path for radicale-docs project'
     )
+    parser.add_argument(
+        '--list-headings',
+        action='store_true',
+        help='List the heading paths of the source with their line spans, then exit'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Number of worker processes for converting sections (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--manifest',
+        type=Path,
+        default=None,
+        help=f'Record of what each target was generated from (default: BASE/{MANIFEST_NAME})'
+    )
+    parser.add_argument(
+        '--no-manifest',
+        action='store_true',
+        help='Regenerate every section without reading or updating the manifest'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate targets even if they were edited after they were generated'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Report out-of-date targets without writing anything; exit 1 if there are any'
+    )
+    parser.add_argument(
+        '--accept',
+        action='store_true',
+        help='Record the targets as they are now, keeping hand edits, without regenerating them'
+    )
 
     args = parser.parse_args()
 
-    # Read source file
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    # Index headings once; sections with a heading are looked up in it
     print(f"Reading source: {args.source}")
-    source_lines = read_source_file(args.source)
-    print(f"Loaded {len(source_lines)} lines")
+    heading_index = index_source_file(args.source)
+    print(f"Loaded {heading_index.line_count} lines")
+
+    if args.list_headings:
+        for path, (start_line, end_line) in sorted(heading_index.paths.items(), key=lambda item: item[1]):
+            print(f"{start_line:>6}-{end_line:<6} {path}")
+        return
 
     # Filter sections if requested
     sections_to_migrate = SECTIONS
@@ -386,17 +959,73 @@ def main():
             print(f"No sections found matching: {args.section}", file=sys.stderr)
             sys.exit(1)
 
+    for option in ('check', 'accept'):
+        if getattr(args, option) and args.no_manifest:
+            print(f"Error: --{option} needs the manifest and cannot be used with --no-manifest", file=sys.stderr)
+            sys.exit(1)
+    if args.check and args.accept:
+        print("Error: --check and --accept cannot be combined", file=sys.stderr)
+        sys.exit(1)
+
+    manifest = None
+    if not args.no_manifest:
+        manifest = MigrationManifest(args.manifest or args.base / MANIFEST_NAME)
+
+    failed: List[Section] = []
+    extracted = extract_sections(args.source, sections_to_migrate, heading_index, failed)
+
+    if args.check:
+        stale = check_sections(extracted, manifest, args.base)
+        if failed:
+            # A section that cannot be extracted cannot be up to date
+            print(f"\n{stale} section(s) out of date, {len(failed)} could not be extracted: "
+                  f"{', '.join(s.title for s in failed)}")
+            sys.exit(1)
+        if stale:
+            print(f"\n{stale} section(s) out of date; run without --check to regenerate")
+            sys.exit(1)
+        print("\nAll sections up to date")
+        return
+
+    if args.accept:
+        accepted = accept_sections(extracted, manifest, args.base)
+        if not args.dry_run:
+            manifest.save(SECTIONS)
+        print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Accepted {accepted} target(s)")
+        if failed:
+            print(f"Failed {len(failed)} section(s): {', '.join(s.title for s in failed)}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     print(f"\nMigrating {len(sections_to_migrate)} section(s)...")
 
-    # Migrate each section
-    for section in sections_to_migrate:
-        migrate_section(source_lines, section, args.base, args.dry_run)
+    # Migrate each section as soon as the sweep over the source completes it,
+    # skipping those whose inputs and target still match the manifest
+    skipped: List[Section] = []
+    if manifest is not None:
+        extracted = outdated_sections(extracted, manifest, args.base, args.force, skipped)
+    jobs = min(args.jobs or os.cpu_count() or 1, len(sections_to_migrate))
+    # About one batch per worker for small sources (the file size stands in
+    # for the total section content, which is only known after the sweep)
+    batch_chars = max(MIN_BATCH_CHARS, min(BATCH_CHARS, args.source.stat().st_size // jobs))
+    written = migrate_sections(extracted, args.base, args.dry_run, jobs, manifest, batch_chars)
+
+    if manifest is not None and not args.dry_run:
+        manifest.save(SECTIONS)
 
     print(f"\n{'[DRY RUN] ' if args.dry_run else ''}Migration complete!")
     print(f"Processed {len(sections_to_migrate)} section(s)")
+    if skipped:
+        print(f"Skipped {len(skipped)} section(s) up to date or edited by hand")
+    if not args.dry_run:
+        print(f"Wrote {written} file(s)")
+    if failed:
+        print(f"Failed {len(failed)} section(s): {', '.join(s.title for s in failed)}", file=sys.stderr)
 
     if args.dry_run:
         print("\nRun without --dry-run to actually create files.")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -43,6 +43,67 @@ python3 scripts/migrate-docs.py --dry-run --section "metrics" 2>&1 | grep -q "Mi
 echo "✓ Section filtering works"
 echo ""
 
+# Test 6: Benchmark smoke run
+echo "Test 6: Running a tiny benchmark..."
+python3 scripts/benchmark-scripts.py run --sizes 20 --no-compare 2>&1 | grep -q "scan_directory"
+echo "✓ Benchmark suite runs"
+echo ""
+
+# Test 7: Custom rule pack
+echo "Test 7: Checking with the example rule pack..."
+python3 scripts/check-diataxis.py --no-cache --rules scripts/diataxis-rules.example.toml src/content/docs 2>&1 | grep -q "SUMMARY"
+echo "✓ Rule packs load"
+echo ""
+
+# Test 8: Learned indicator weights
+echo "Test 8: Fitting indicator weights..."
+python3 scripts/check-diataxis.py fit-weights -o /tmp/diataxis-weights.json src/content/docs > /dev/null
+python3 scripts/check-diataxis.py --no-cache --rules /tmp/diataxis-weights.json src/content/docs 2>&1 | grep -q "SUMMARY"
+echo "✓ Indicator weights fit and load"
+echo ""
+
+# Test 9: Language server handshake
+echo "Test 9: Starting and stopping the language server..."
+python3 - <<'PYTHON'
+import json
+import subprocess
+
+messages = [
+    {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+    {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+    {"jsonrpc": "2.0", "method": "exit"},
+]
+data = b"".join(
+    b"Content-Length: %d\r\n\r\n" % len(body) + body
+    for body in (json.dumps(message).encode() for message in messages)
+)
+result = subprocess.run(["python3", "scripts/diataxis-lsp.py"], input=data, capture_output=True, check=True)
+assert b'"textDocumentSync"' in result.stdout
+PYTHON
+echo "✓ Language server responds"
+echo ""
+
+# Test 10: Language server state stays bounded while typing
+echo "Test 10: Typing into a matched phrase in the language server..."
+python3 - <<'PYTHON'
+import importlib.util
+
+spec = importlib.util.spec_from_file_location("lsp", "scripts/diataxis-lsp.py")
+lsp = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lsp)
+
+doc = lsp.OpenDocument("file:///x.mdx", "---\ntitle: x\ndescription: y\ndiataxis_type: how-to\n---\nfirst do then\n")
+doc.diagnostics()
+kinds = len(lsp.check_diataxis._VIOLATION_KINDS)
+edit = {"range": {"start": {"line": 5, "character": 8}, "end": {"line": 5, "character": 8}}, "text": "x"}
+for _ in range(500):
+    doc.apply_change(edit)
+    doc.diagnostics()
+assert len(lsp.check_diataxis._VIOLATION_KINDS) == kinds
+PYTHON
+echo "✓ Violation kinds do not grow with edits"
+echo ""
+
 echo "==========================================="
 echo "All tests passed!"
 echo "==========================================="